@@ -33,6 +33,9 @@ class BaseConfig(BaseSettings):
 
     JWT_KEY: str
 
+    # bcrypt work factor (log2 rounds) for newly hashed passwords
+    BCRYPT_ROUNDS: int = 12
+
     @field_validator('JWT_KEY')
     @classmethod
     def jwt_key_must_be_strong(cls, v: str) -> str:
@@ -131,7 +134,8 @@ class DevConfig(BaseConfig):
     DEBUG: bool = True
 
 class TestConfig(BaseConfig):
-    pass
+    # bcrypt's minimum cost; existing hashes still verify at whatever cost they carry
+    BCRYPT_ROUNDS: int = 4
 
 class ProdConfig(BaseConfig):
     pass
@@ -50,21 +50,7 @@ class ApprovalRepository(BaseRepository):
     """Repository for ApprovalRequest aggregate persistence operations."""
 
     def add(self, approval: ApprovalRequest) -> ApprovalRequest:
-        entity = ApprovalRequestORM(
-            id=UUID(approval.id),
-            type=approval.type.value,
-            status=approval.status.value,
-            requester_id=UUID(approval.requester_id),
-            detail_json=approval.detail_dict(),
-        )
-
-        for step in approval.steps:
-            step_entity = ApprovalStepORM(
-                step_order=step.step_order,
-                approver_id=UUID(step.approver_id),
-                status=step.status.value,
-            )
-            entity.steps.append(step_entity)
+        entity = self._to_entity(approval)
 
         self.db.add(entity)
         self.db.flush()
@@ -72,6 +58,11 @@ class ApprovalRepository(BaseRepository):
 
         return self._to_domain_model(entity)
 
+    def add_all(self, approvals: list[ApprovalRequest]) -> None:
+        """Persist several approval requests with a single flush."""
+        self.db.add_all([self._to_entity(approval) for approval in approvals])
+        self.db.flush()
+
     def get_by_id(self, request_id: str) -> ApprovalRequest | None:
         entity = self.db.query(ApprovalRequestORM).filter(
             ApprovalRequestORM.id == UUID(request_id)
@@ -107,6 +98,25 @@ class ApprovalRepository(BaseRepository):
 
         return self._to_domain_model(entity)
 
+    def _to_entity(self, approval: ApprovalRequest) -> ApprovalRequestORM:
+        entity = ApprovalRequestORM(
+            id=UUID(approval.id),
+            type=approval.type.value,
+            status=approval.status.value,
+            requester_id=UUID(approval.requester_id),
+            detail_json=approval.detail_dict(),
+        )
+
+        for step in approval.steps:
+            step_entity = ApprovalStepORM(
+                step_order=step.step_order,
+                approver_id=UUID(step.approver_id),
+                status=step.status.value,
+            )
+            entity.steps.append(step_entity)
+
+        return entity
+
     def _to_domain_model(self, entity: ApprovalRequestORM) -> ApprovalRequest:
         approval_type = ApprovalType(entity.type)
 
@@ -7,10 +7,16 @@ via passlib.
 """
 import bcrypt
 
+from app.config import get_settings
+
 
 def hash_password(plain: str) -> str:
-    """Hash a plaintext password with bcrypt. Returns a $2b$... string."""
-    return bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    """Hash a plaintext password with bcrypt. Returns a $2b$... string.
+
+    The cost factor comes from ``BCRYPT_ROUNDS`` (lowered under the test profile).
+    """
+    salt = bcrypt.gensalt(rounds=get_settings().BCRYPT_ROUNDS)
+    return bcrypt.hashpw(plain.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(plain: str, hashed: str) -> bool:
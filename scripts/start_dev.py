@@ -1,4 +1,5 @@
 import argparse
+import os
 import subprocess
 from dataclasses import dataclass
 
@@ -62,7 +63,8 @@ def test():
     subprocess.run(["pytest", "-vv", "-s", "tests"])
 
 def test_cov():
-    subprocess.run(["pytest", "--cov=app", "--cov-report=html"])
+    env = {"COVERAGE_CORE": "sysmon", **os.environ}
+    subprocess.run(["pytest", "--cov=app", "--cov-report=html"], env=env)
 
 if __name__ == '__main__':
     main()
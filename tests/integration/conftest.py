@@ -2,20 +2,33 @@
 Integration test shared fixtures.
 
 策略：
-- 每個測試建立獨立的 SQLite in-memory 資料庫（function scope）
+- 每個測試建立獨立的 SQLite in-memory 資料庫（function scope），
+  schema 只在 session 開始時建立一次，之後以 sqlite backup API 複製到各測試的資料庫
 - 透過 monkeypatch 將所有 UnitOfWork 模組的 engine 替換為測試用 engine
+- FastAPI app / TestClient 為 session scope，僅建立一次
+- pytest-xdist 下各 worker 各自建立 app 與 schema 範本：in-memory 資料庫無法跨 process
+  共用，且每個 worker 的建立成本僅數十 ms，不需以 file lock 協調跨 worker 共用
+- 設定 TEST_FAST_JWT=1 時，以 base64(JSON) 取代 JWT 的 HS256 簽章
 - 僅 mock 外部服務（Email、Kafka、MQTT）
 - 測試流程：HTTP request → Router → Service → Repository → SQLite DB
 """
+import base64
+import functools
 import importlib
+import json
+import os
+import time
+import httpx
+import jwt
 import pytest
+import pytest_asyncio
 import uuid
-from datetime import date
-from uuid import uuid4
+from datetime import date, datetime
+from unittest.mock import AsyncMock, patch
 
 from uuid import UUID as PyUUID
 
-from sqlalchemy import create_engine, BigInteger, Uuid as SaUuid
+from sqlalchemy import create_engine, event, BigInteger, Uuid as SaUuid
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker, Session
 from fastapi import FastAPI
@@ -53,7 +66,8 @@ SaUuid.bind_processor = _patched_uuid_bind_processor
 from app.db import Base
 from database.models.user import User, Profile
 from app.domain.UserModel import UserRole
-from app.utils.password import hash_password as _hash_password
+from app.utils import token_generator
+from app.utils.password import hash_password
 
 # UnitOfWork 模組清單（所有需要替換 engine 的模組）
 _UOW_MODULES = [
@@ -72,23 +86,57 @@ _UOW_MODULES = [
 ]
 
 
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """每條新連線的 SQLite 設定。
+
+    測試透過單一 client 依序發出請求，不會有真正的鎖競爭，因此關閉 busy handler
+    （pysqlite 預設會等待 5 秒），遇到鎖時立即失敗而不是退避重試。
+    測試資料庫不需持久化：關閉 fsync、暫存表放記憶體，journal 也只留在記憶體
+    （in-memory 資料庫本就如此，明確設定以免日後改成檔案資料庫時退回預設）。
+    不使用 locking_mode=EXCLUSIVE，因為巢狀 UoW 需要同時開第二條連線。
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA busy_timeout=0")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@pytest.fixture(scope="session")
+def _schema_template():
+    """整個 session 只執行一次 create_all，作為各測試資料庫的 schema 範本。"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    raw = engine.raw_connection()
+    yield raw.driver_connection
+    raw.close()
+    engine.dispose()
+
+
 @pytest.fixture
-def test_engine():
+def test_engine(_schema_template):
     """每個測試用獨立的 in-memory SQLite 資料庫（shared cache，跨執行緒可用）。
 
     使用 shared-cache 模式讓 seed 資料與 HTTP 請求（不同執行緒）使用同一個 DB，
-    並用唯一的 db_name 確保測試間完全隔離。
+    並用唯一的 db_name 確保測試間完全隔離。schema 由 _schema_template 以 backup 複製
+    （遠比每個測試 create_all 快）；測試結束時 dispose 關閉所有連線，in-memory 資料庫
+    隨之釋放，不需 drop_all。db_name 另帶 pytest-xdist 的 worker id，
+    `pytest -n auto` 時各 worker 的資料庫名稱互不重疊，也便於除錯時辨識來源。
     """
-    db_name = f"testdb_{uuid.uuid4().hex}"
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    db_name = f"testdb_{worker}_{uuid.uuid4().hex}"
     url = f"sqlite:///file:{db_name}?mode=memory&cache=shared&uri=true"
     engine = create_engine(
         url,
         connect_args={"check_same_thread": False},
         echo=False,
     )
-    Base.metadata.create_all(engine)
+    event.listen(engine, "connect", _configure_sqlite_connection)
+    raw = engine.raw_connection()
+    _schema_template.backup(raw.driver_connection)
+    raw.close()
     yield engine
-    Base.metadata.drop_all(engine)
     engine.dispose()
 
 
@@ -109,6 +157,64 @@ def patch_uow_engines(test_engine, monkeypatch):
             monkeypatch.setattr(mod, "engine", test_engine)
 
 
+class _FastJWT:
+    """token_generator 所用 jwt 模組的替身：不簽章，只做 base64(JSON) 編解碼。
+
+    仍保留 exp 過期檢查與格式錯誤時拋出 InvalidTokenError 的行為。
+    """
+
+    ExpiredSignatureError = jwt.ExpiredSignatureError
+    InvalidTokenError = jwt.InvalidTokenError
+
+    @staticmethod
+    def encode(payload: dict, key: str, algorithm: str | None = None) -> str:
+        claims = {
+            k: int(v.timestamp()) if isinstance(v, datetime) else v
+            for k, v in payload.items()
+        }
+        return base64.urlsafe_b64encode(json.dumps(claims).encode()).decode()
+
+    @staticmethod
+    def decode(token: str, key: str, algorithms: list[str] | None = None, **kwargs) -> dict:
+        try:
+            claims = json.loads(base64.urlsafe_b64decode(token.encode()))
+        except (ValueError, TypeError) as exc:
+            raise jwt.InvalidTokenError(str(exc)) from exc
+        if not isinstance(claims, dict):
+            raise jwt.InvalidTokenError("Invalid payload")
+        if claims.get("exp") is not None and claims["exp"] < time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        return claims
+
+
+@pytest.fixture(autouse=True)
+def fast_jwt(monkeypatch):
+    """TEST_FAST_JWT=1 時跳過 JWT 簽章運算；預設仍使用真實的 PyJWT。"""
+    if os.getenv("TEST_FAST_JWT") == "1":
+        monkeypatch.setattr(token_generator, "jwt", _FastJWT)
+
+
+@pytest.fixture(scope="package", autouse=True)
+def mock_verification_email():
+    """整個 integration 套件只 patch 一次驗證信寄送（外部服務），各測試不需再各自 patch。
+
+    使用 package scope，離開 integration 套件時即還原，不影響之後執行的其他測試套件。
+    需要檢查寄信呼叫的測試請改用 verification_email，取得已清空呼叫紀錄的同一個 mock。
+    """
+    with patch(
+        "app.services.EmailService.EmailService.send_verification_email",
+        new_callable=AsyncMock,
+    ) as mock_send:
+        yield mock_send
+
+
+@pytest.fixture
+def verification_email(mock_verification_email) -> AsyncMock:
+    """清空呼叫紀錄後的驗證信 mock，供測試檢查本次是否寄出驗證信。"""
+    mock_verification_email.reset_mock()
+    return mock_verification_email
+
+
 @pytest.fixture
 def db_session(test_engine) -> Session:
     """提供直接操作測試資料庫的 session，用於 seed 資料。"""
@@ -118,6 +224,12 @@ def db_session(test_engine) -> Session:
     session.close()
 
 
+@functools.lru_cache(maxsize=None)
+def _hash_password(password: str) -> str:
+    """seed 密碼的 bcrypt hash 整個 session 只算一次；bcrypt hash 內含 salt，重複使用不影響驗證。"""
+    return hash_password(password)
+
+
 def _seed_user(
     session: Session,
     uid: str,
@@ -127,8 +239,11 @@ def _seed_user(
     name: str = "",
     email_verified: bool = True,
 ) -> dict:
-    """在測試資料庫中建立 User + Profile，回傳帳號資訊 dict。"""
-    user_id = uuid4()
+    """在測試資料庫中建立 User + Profile，回傳帳號資訊 dict。
+
+    回傳值只用到本地已知的欄位，因此 commit 後不需再 refresh（省一次 SELECT）。
+    """
+    user_id = uuid.uuid4()
     user = User(
         id=user_id,
         uid=uid,
@@ -136,16 +251,14 @@ def _seed_user(
         email=email,
         role=role,
         email_verified=email_verified,
+        profile=Profile(
+            name=name or uid,
+            birthdate=date(1990, 1, 1),
+            description="",
+        ),
     )
-    profile = Profile(
-        name=name or uid,
-        birthdate=date(1990, 1, 1),
-        description="",
-    )
-    user.profile = profile
     session.add(user)
     session.commit()
-    session.refresh(user)
     return {
         "id": str(user_id),
         "uid": uid,
@@ -232,11 +345,34 @@ def _create_test_app() -> FastAPI:
     return test_app
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """提供 FastAPI TestClient，使用真實 Router/Service/Repository 層。"""
-    app = _create_test_app()
-    with TestClient(app, raise_server_exceptions=True) as c:
+@pytest.fixture(scope="session")
+def test_app() -> FastAPI:
+    """整個測試 session 共用的 FastAPI app。"""
+    return _create_test_app()
+
+
+@pytest.fixture(scope="session")
+def client(test_app: FastAPI) -> TestClient:
+    """提供 FastAPI TestClient，使用真實 Router/Service/Repository 層。
+
+    整個測試 session 共用同一個 app 與 TestClient；資料隔離由每個測試獨立的
+    test_engine（經 patch_uow_engines 注入）負責，UoW 於每次請求時才讀取 engine。
+    """
+    with TestClient(test_app, raise_server_exceptions=True) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(test_app: FastAPI) -> httpx.ASGITransport:
+    """整個 session 共用的 ASGITransport（無狀態，關閉 client 時不會被釋放）。"""
+    return httpx.ASGITransport(app=test_app)
+
+
+@pytest_asyncio.fixture
+async def async_client(asgi_transport: httpx.ASGITransport) -> httpx.AsyncClient:
+    """提供 httpx.AsyncClient（ASGITransport），請求直接在測試的 event loop 上執行，
+    不經過 TestClient 的 thread portal。"""
+    async with httpx.AsyncClient(transport=asgi_transport, base_url="http://testserver") as c:
         yield c
 
 
@@ -250,6 +386,36 @@ def get_auth_token(client: TestClient, uid_or_email: str, password: str) -> str:
     return resp.json()["access_token"]
 
 
+async def get_auth_token_async(client: httpx.AsyncClient, uid_or_email: str, password: str) -> str:
+    """get_auth_token 的非同步版本，供 async_client 使用。"""
+    resp = await client.post(
+        "/users/login",
+        data={"username": uid_or_email, "password": password},
+    )
+    assert resp.status_code == 200, f"Login failed: {resp.text}"
+    return resp.json()["access_token"]
+
+
+def mint_token(user: dict) -> str:
+    """直接為 seed 帳號簽發 JWT，不經 /users/login（省下 bcrypt 驗證與登入紀錄寫入）。
+
+    僅供不驗證登入流程本身的測試使用；需要登入副作用的測試請改用 get_auth_token。
+    """
+    return token_generator.generate_token(user["id"], user["uid"])
+
+
 def auth_headers(token: str) -> dict:
     """回傳 Authorization header dict。"""
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def admin_headers(seed_admin: dict) -> dict:
+    """Admin 測試帳號的 Authorization header（token 直接簽發，每個測試只建一次）。"""
+    return auth_headers(mint_token(seed_admin))
+
+
+@pytest.fixture
+def normal_user_headers(seed_normal_user: dict) -> dict:
+    """一般使用者測試帳號的 Authorization header。"""
+    return auth_headers(mint_token(seed_normal_user))
@@ -8,40 +8,76 @@ Tests the full HTTP → Router → Service → Repository → SQLite stack for:
 - Global SSO config get / update
 - Access control (admin-only enforcement)
 """
+import copy
+
 import pytest
+import pytest_asyncio
+
+from tests.integration.conftest import get_auth_token_async, auth_headers
 
-from tests.integration.conftest import get_auth_token, auth_headers
+pytestmark = pytest.mark.asyncio
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+_MISSING_PROVIDER_ID = "00000000-0000-0000-0000-000000000000"
+
+_BASE_OIDC_PAYLOAD = {
+    "name": "Test OIDC",
+    "slug": "test-oidc",
+    "protocol": "OIDC",
+    "oidc_config": {
+        "client_id": "test-client-id",
+        "client_secret": "test-client-secret",
+        "authorization_url": "https://idp.example.com/auth",
+        "token_url": "https://idp.example.com/token",
+        "userinfo_url": "https://idp.example.com/userinfo",
+        "jwks_uri": None,
+        "scopes": "openid email profile",
+    },
+    "attribute_mapping": {
+        "email": "email",
+        "name": "name",
+        "external_id": "sub",
+    },
+    "display_order": 0,
+}
+
+
 def _oidc_provider_payload(
     name: str = "Test OIDC",
     slug: str = "test-oidc",
     display_order: int = 0,
 ) -> dict:
-    return {
-        "name": name,
-        "slug": slug,
-        "protocol": "OIDC",
-        "oidc_config": {
-            "client_id": "test-client-id",
-            "client_secret": "test-client-secret",
-            "authorization_url": "https://idp.example.com/auth",
-            "token_url": "https://idp.example.com/token",
-            "userinfo_url": "https://idp.example.com/userinfo",
-            "jwks_uri": None,
-            "scopes": "openid email profile",
-        },
-        "attribute_mapping": {
-            "email": "email",
-            "name": "name",
-            "external_id": "sub",
-        },
-        "display_order": display_order,
-    }
+    payload = copy.deepcopy(_BASE_OIDC_PAYLOAD)
+    payload.update(name=name, slug=slug, display_order=display_order)
+    return payload
+
+
+@pytest_asyncio.fixture
+async def admin_token(async_client, seed_admin) -> str:
+    """Admin 登入後的 access token。"""
+    return await get_auth_token_async(async_client, seed_admin["uid"], seed_admin["password"])
+
+
+@pytest_asyncio.fixture
+async def user_token(async_client, seed_normal_user) -> str:
+    """一般使用者登入後的 access token。"""
+    return await get_auth_token_async(async_client, seed_normal_user["uid"], seed_normal_user["password"])
+
+
+@pytest_asyncio.fixture
+async def created_provider(async_client, admin_token) -> dict:
+    """由 Admin 建立一個（預設未啟用的）OIDC provider，回傳建立回應。"""
+    resp = await async_client.post(
+        "/sso/admin/providers",
+        json=_oidc_provider_payload(),
+        headers=auth_headers(admin_token),
+    )
+    assert resp.status_code == 200
+    return resp.json()
 
 
 # ---------------------------------------------------------------------------
@@ -51,39 +87,31 @@ def _oidc_provider_payload(
 class TestListPublicProviders:
     """測試公開的 SSO providers 端點（無需認證）。"""
 
-    def test_list_providers_returns_empty_when_none_active(self, client):
+    async def test_list_providers_returns_empty_when_none_active(self, async_client):
         """沒有啟用的 provider 時，回傳空列表。"""
-        resp = client.get("/sso/providers")
+        resp = await async_client.get("/sso/providers")
         assert resp.status_code == 200
         body = resp.json()
         assert "providers" in body
         assert body["providers"] == []
 
-    def test_list_providers_only_shows_active(self, client, seed_admin):
+    async def test_list_providers_only_shows_active(self, async_client, admin_token, created_provider):
         """只有啟用 (is_active=True) 的 provider 才出現在公開列表。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        # 建立 provider（預設未啟用）
-        create_resp = client.post(
-            "/sso/admin/providers",
-            json=_oidc_provider_payload("Inactive Provider", "inactive-oidc"),
-            headers=auth_headers(token),
-        )
-        assert create_resp.status_code == 200
-        provider_id = create_resp.json()["id"]
+        provider_id = created_provider["id"]
 
         # 公開列表應為空（尚未啟用）
-        public_resp = client.get("/sso/providers")
+        public_resp = await async_client.get("/sso/providers")
         assert public_resp.status_code == 200
         assert public_resp.json()["providers"] == []
 
         # 啟用後應出現在公開列表
-        client.post(f"/sso/admin/providers/{provider_id}/activate", headers=auth_headers(token))
+        await async_client.post(f"/sso/admin/providers/{provider_id}/activate", headers=auth_headers(admin_token))
 
-        public_resp2 = client.get("/sso/providers")
+        public_resp2 = await async_client.get("/sso/providers")
         assert public_resp2.status_code == 200
         providers = public_resp2.json()["providers"]
         assert len(providers) == 1
-        assert providers[0]["slug"] == "inactive-oidc"
+        assert providers[0]["slug"] == created_provider["slug"]
 
 
 # ---------------------------------------------------------------------------
@@ -93,24 +121,22 @@ class TestListPublicProviders:
 class TestAdminListProviders:
     """測試管理員列表 SSO providers。"""
 
-    def test_admin_can_list_providers_empty(self, client, seed_admin):
+    async def test_admin_can_list_providers_empty(self, async_client, admin_token):
         """Admin 查詢空列表。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.get("/sso/admin/providers", headers=auth_headers(token))
+        resp = await async_client.get("/sso/admin/providers", headers=auth_headers(admin_token))
         assert resp.status_code == 200
         body = resp.json()
         assert "providers" in body
         assert body["providers"] == []
 
-    def test_normal_user_cannot_list_admin_providers(self, client, seed_normal_user):
+    async def test_normal_user_cannot_list_admin_providers(self, async_client, user_token):
         """一般使用者無法存取管理員列表，回傳 403。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.get("/sso/admin/providers", headers=auth_headers(token))
+        resp = await async_client.get("/sso/admin/providers", headers=auth_headers(user_token))
         assert resp.status_code == 403
 
-    def test_unauthenticated_cannot_list_admin_providers(self, client):
+    async def test_unauthenticated_cannot_list_admin_providers(self, async_client):
         """未認證使用者無法存取，回傳 401。"""
-        resp = client.get("/sso/admin/providers")
+        resp = await async_client.get("/sso/admin/providers")
         assert resp.status_code == 401
 
 
@@ -121,13 +147,12 @@ class TestAdminListProviders:
 class TestAdminCreateProvider:
     """測試管理員建立 SSO provider。"""
 
-    def test_admin_can_create_oidc_provider(self, client, seed_admin):
-        """Admin 成功建立 OIDC provider。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.post(
+    async def test_admin_can_create_oidc_provider(self, async_client, admin_token):
+        """Admin 成功建立 OIDC provider，且建立後出現在 admin 列表。"""
+        resp = await async_client.post(
             "/sso/admin/providers",
             json=_oidc_provider_payload(),
-            headers=auth_headers(token),
+            headers=auth_headers(admin_token),
         )
         assert resp.status_code == 200
         body = resp.json()
@@ -137,37 +162,30 @@ class TestAdminCreateProvider:
         assert body["is_active"] is False  # 預設未啟用
         assert "id" in body
 
-    def test_create_provider_reflected_in_list(self, client, seed_admin):
-        """建立後，provider 出現在 admin 列表。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        client.post("/sso/admin/providers", json=_oidc_provider_payload(), headers=auth_headers(token))
-
-        list_resp = client.get("/sso/admin/providers", headers=auth_headers(token))
+        list_resp = await async_client.get("/sso/admin/providers", headers=auth_headers(admin_token))
         assert list_resp.status_code == 200
         assert len(list_resp.json()["providers"]) == 1
 
-    def test_non_admin_cannot_create_provider(self, client, seed_normal_user):
+    async def test_non_admin_cannot_create_provider(self, async_client, user_token):
         """一般使用者無法建立 provider，回傳 403。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.post(
+        resp = await async_client.post(
             "/sso/admin/providers",
             json=_oidc_provider_payload(),
-            headers=auth_headers(token),
+            headers=auth_headers(user_token),
         )
         assert resp.status_code == 403
 
-    def test_unauthenticated_cannot_create_provider(self, client):
+    async def test_unauthenticated_cannot_create_provider(self, async_client):
         """未認證使用者無法建立，回傳 401。"""
-        resp = client.post("/sso/admin/providers", json=_oidc_provider_payload())
+        resp = await async_client.post("/sso/admin/providers", json=_oidc_provider_payload())
         assert resp.status_code == 401
 
-    def test_create_provider_missing_required_fields_returns_422(self, client, seed_admin):
+    async def test_create_provider_missing_required_fields_returns_422(self, async_client, admin_token):
         """缺少必填欄位，回傳 422。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.post(
+        resp = await async_client.post(
             "/sso/admin/providers",
             json={"name": "No Slug"},  # missing slug, protocol
-            headers=auth_headers(token),
+            headers=auth_headers(admin_token),
         )
         assert resp.status_code == 422
 
@@ -179,37 +197,19 @@ class TestAdminCreateProvider:
 class TestAdminGetProvider:
     """測試管理員取得單一 SSO provider。"""
 
-    def test_admin_can_get_provider(self, client, seed_admin):
+    async def test_admin_can_get_provider(self, async_client, admin_token, created_provider):
         """Admin 成功取得 provider 詳情。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        create_resp = client.post(
-            "/sso/admin/providers", json=_oidc_provider_payload(), headers=auth_headers(token)
-        )
-        provider_id = create_resp.json()["id"]
+        provider_id = created_provider["id"]
 
-        resp = client.get(f"/sso/admin/providers/{provider_id}", headers=auth_headers(token))
+        resp = await async_client.get(f"/sso/admin/providers/{provider_id}", headers=auth_headers(admin_token))
         assert resp.status_code == 200
         assert resp.json()["id"] == provider_id
 
-    def test_get_nonexistent_provider_returns_404(self, client, seed_admin):
-        """取得不存在的 provider，回傳 404。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.get(
-            "/sso/admin/providers/00000000-0000-0000-0000-000000000000",
-            headers=auth_headers(token),
-        )
-        assert resp.status_code == 404
-
-    def test_non_admin_cannot_get_provider(self, client, seed_normal_user, seed_admin):
+    async def test_non_admin_cannot_get_provider(self, async_client, user_token, created_provider):
         """一般使用者無法取得 provider 詳情，回傳 403。"""
-        admin_token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        create_resp = client.post(
-            "/sso/admin/providers", json=_oidc_provider_payload(), headers=auth_headers(admin_token)
-        )
-        provider_id = create_resp.json()["id"]
+        provider_id = created_provider["id"]
 
-        user_token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.get(f"/sso/admin/providers/{provider_id}", headers=auth_headers(user_token))
+        resp = await async_client.get(f"/sso/admin/providers/{provider_id}", headers=auth_headers(user_token))
         assert resp.status_code == 403
 
 
@@ -220,39 +220,24 @@ class TestAdminGetProvider:
 class TestAdminUpdateProvider:
     """測試管理員更新 SSO provider。"""
 
-    def test_admin_can_update_provider_name(self, client, seed_admin):
+    async def test_admin_can_update_provider_name(self, async_client, admin_token, created_provider):
         """Admin 成功更新 provider 名稱。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        create_resp = client.post(
-            "/sso/admin/providers", json=_oidc_provider_payload(), headers=auth_headers(token)
-        )
-        provider_id = create_resp.json()["id"]
+        provider_id = created_provider["id"]
 
-        update_resp = client.put(
+        update_resp = await async_client.put(
             f"/sso/admin/providers/{provider_id}",
             json={"name": "Updated OIDC Provider"},
-            headers=auth_headers(token),
+            headers=auth_headers(admin_token),
         )
         assert update_resp.status_code == 200
         assert update_resp.json()["name"] == "Updated OIDC Provider"
 
-    def test_update_nonexistent_provider_returns_404(self, client, seed_admin):
-        """更新不存在的 provider，回傳 404。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.put(
-            "/sso/admin/providers/00000000-0000-0000-0000-000000000000",
-            json={"name": "New Name"},
-            headers=auth_headers(token),
-        )
-        assert resp.status_code == 404
-
-    def test_non_admin_cannot_update_provider(self, client, seed_normal_user):
+    async def test_non_admin_cannot_update_provider(self, async_client, user_token):
         """一般使用者無法更新 provider，回傳 403。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.put(
-            "/sso/admin/providers/00000000-0000-0000-0000-000000000000",
+        resp = await async_client.put(
+            f"/sso/admin/providers/{_MISSING_PROVIDER_ID}",
             json={"name": "Hack"},
-            headers=auth_headers(token),
+            headers=auth_headers(user_token),
         )
         assert resp.status_code == 403
 
@@ -264,37 +249,23 @@ class TestAdminUpdateProvider:
 class TestAdminDeleteProvider:
     """測試管理員刪除 SSO provider。"""
 
-    def test_admin_can_delete_provider(self, client, seed_admin):
+    async def test_admin_can_delete_provider(self, async_client, admin_token, created_provider):
         """Admin 成功刪除 provider。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        create_resp = client.post(
-            "/sso/admin/providers", json=_oidc_provider_payload(), headers=auth_headers(token)
-        )
-        provider_id = create_resp.json()["id"]
+        provider_id = created_provider["id"]
 
-        del_resp = client.delete(f"/sso/admin/providers/{provider_id}", headers=auth_headers(token))
+        del_resp = await async_client.delete(f"/sso/admin/providers/{provider_id}", headers=auth_headers(admin_token))
         assert del_resp.status_code == 200
         assert del_resp.json()["message"] == "SSO Provider deleted."
 
         # 確認已刪除
-        get_resp = client.get(f"/sso/admin/providers/{provider_id}", headers=auth_headers(token))
+        get_resp = await async_client.get(f"/sso/admin/providers/{provider_id}", headers=auth_headers(admin_token))
         assert get_resp.status_code == 404
 
-    def test_delete_nonexistent_provider_returns_404(self, client, seed_admin):
-        """刪除不存在的 provider，回傳 404。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.delete(
-            "/sso/admin/providers/00000000-0000-0000-0000-000000000000",
-            headers=auth_headers(token),
-        )
-        assert resp.status_code == 404
-
-    def test_non_admin_cannot_delete_provider(self, client, seed_normal_user):
+    async def test_non_admin_cannot_delete_provider(self, async_client, user_token):
         """一般使用者無法刪除，回傳 403。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.delete(
-            "/sso/admin/providers/00000000-0000-0000-0000-000000000000",
-            headers=auth_headers(token),
+        resp = await async_client.delete(
+            f"/sso/admin/providers/{_MISSING_PROVIDER_ID}",
+            headers=auth_headers(user_token),
         )
         assert resp.status_code == 403
 
@@ -306,56 +277,50 @@ class TestAdminDeleteProvider:
 class TestAdminActivateDeactivateProvider:
     """測試啟用／停用 SSO provider。"""
 
-    def _create_provider(self, client, token) -> str:
-        resp = client.post(
-            "/sso/admin/providers",
-            json=_oidc_provider_payload("Toggle Provider", "toggle-oidc"),
-            headers=auth_headers(token),
-        )
-        assert resp.status_code == 200
-        return resp.json()["id"]
+    async def test_toggle_provider(self, async_client, admin_token, created_provider):
+        """Admin 可以啟用、再停用 provider。"""
+        provider_id = created_provider["id"]
 
-    def test_admin_can_activate_provider(self, client, seed_admin):
-        """Admin 可以啟用 provider。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        provider_id = self._create_provider(client, token)
-
-        resp = client.post(f"/sso/admin/providers/{provider_id}/activate", headers=auth_headers(token))
+        resp = await async_client.post(f"/sso/admin/providers/{provider_id}/activate", headers=auth_headers(admin_token))
         assert resp.status_code == 200
         assert resp.json()["is_active"] is True
 
-    def test_admin_can_deactivate_provider(self, client, seed_admin):
-        """Admin 可以停用 provider。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        provider_id = self._create_provider(client, token)
-
-        # 先啟用
-        client.post(f"/sso/admin/providers/{provider_id}/activate", headers=auth_headers(token))
-
-        # 再停用
-        resp = client.post(f"/sso/admin/providers/{provider_id}/deactivate", headers=auth_headers(token))
+        resp = await async_client.post(f"/sso/admin/providers/{provider_id}/deactivate", headers=auth_headers(admin_token))
         assert resp.status_code == 200
         assert resp.json()["is_active"] is False
 
-    def test_activate_nonexistent_provider_returns_404(self, client, seed_admin):
-        """啟用不存在的 provider，回傳 404。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.post(
-            "/sso/admin/providers/00000000-0000-0000-0000-000000000000/activate",
-            headers=auth_headers(token),
-        )
-        assert resp.status_code == 404
-
-    def test_non_admin_cannot_activate_provider(self, client, seed_normal_user):
+    async def test_non_admin_cannot_activate_provider(self, async_client, user_token):
         """一般使用者無法啟用，回傳 403。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.post(
-            "/sso/admin/providers/00000000-0000-0000-0000-000000000000/activate",
-            headers=auth_headers(token),
+        resp = await async_client.post(
+            f"/sso/admin/providers/{_MISSING_PROVIDER_ID}/activate",
+            headers=auth_headers(user_token),
         )
         assert resp.status_code == 403
 
 
+# ---------------------------------------------------------------------------
+# Nonexistent provider id — every admin endpoint returns 404
+# ---------------------------------------------------------------------------
+
+class TestAdminNonexistentProvider:
+    """測試對不存在的 provider 操作皆回傳 404。"""
+
+    @pytest.mark.parametrize(
+        "method, path, body",
+        [
+            ("GET", f"/sso/admin/providers/{_MISSING_PROVIDER_ID}", None),
+            ("PUT", f"/sso/admin/providers/{_MISSING_PROVIDER_ID}", {"name": "New Name"}),
+            ("DELETE", f"/sso/admin/providers/{_MISSING_PROVIDER_ID}", None),
+            ("POST", f"/sso/admin/providers/{_MISSING_PROVIDER_ID}/activate", None),
+        ],
+        ids=["get", "update", "delete", "activate"],
+    )
+    async def test_nonexistent_provider_returns_404(self, async_client, admin_token, method, path, body):
+        """取得／更新／刪除／啟用不存在的 provider，回傳 404。"""
+        resp = await async_client.request(method, path, json=body, headers=auth_headers(admin_token))
+        assert resp.status_code == 404
+
+
 # ---------------------------------------------------------------------------
 # GET /sso/admin/config & PUT /sso/admin/config — global SSO config
 # ---------------------------------------------------------------------------
@@ -363,42 +328,38 @@ class TestAdminActivateDeactivateProvider:
 class TestAdminSSOConfig:
     """測試全域 SSO 設定讀取和更新。"""
 
-    def test_admin_can_get_sso_config(self, client, seed_admin):
+    async def test_admin_can_get_sso_config(self, async_client, admin_token):
         """Admin 可以取得 SSO 設定。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.get("/sso/admin/config", headers=auth_headers(token))
+        resp = await async_client.get("/sso/admin/config", headers=auth_headers(admin_token))
         assert resp.status_code == 200
         body = resp.json()
         assert "auto_create_users" in body
         assert "enforce_sso" in body
 
-    def test_admin_can_update_sso_config(self, client, seed_admin):
+    async def test_admin_can_update_sso_config(self, async_client, admin_token):
         """Admin 可以更新 SSO 設定。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
         update_payload = {
             "auto_create_users": True,
             "enforce_sso": False,
             "default_role": "NORMAL",
         }
-        resp = client.put("/sso/admin/config", json=update_payload, headers=auth_headers(token))
+        resp = await async_client.put("/sso/admin/config", json=update_payload, headers=auth_headers(admin_token))
         assert resp.status_code == 200
         body = resp.json()
         assert body["auto_create_users"] is True
         assert body["enforce_sso"] is False
 
-    def test_normal_user_cannot_get_sso_config(self, client, seed_normal_user):
+    async def test_normal_user_cannot_get_sso_config(self, async_client, user_token):
         """一般使用者無法取得 SSO 設定，回傳 403。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.get("/sso/admin/config", headers=auth_headers(token))
+        resp = await async_client.get("/sso/admin/config", headers=auth_headers(user_token))
         assert resp.status_code == 403
 
-    def test_normal_user_cannot_update_sso_config(self, client, seed_normal_user):
+    async def test_normal_user_cannot_update_sso_config(self, async_client, user_token):
         """一般使用者無法更新 SSO 設定，回傳 403。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.put("/sso/admin/config", json={"auto_create_users": True}, headers=auth_headers(token))
+        resp = await async_client.put("/sso/admin/config", json={"auto_create_users": True}, headers=auth_headers(user_token))
         assert resp.status_code == 403
 
-    def test_unauthenticated_cannot_access_sso_config(self, client):
+    async def test_unauthenticated_cannot_access_sso_config(self, async_client):
         """未認證使用者無法存取，回傳 401。"""
-        assert client.get("/sso/admin/config").status_code == 401
-        assert client.put("/sso/admin/config", json={}).status_code == 401
+        assert (await async_client.get("/sso/admin/config")).status_code == 401
+        assert (await async_client.put("/sso/admin/config", json={})).status_code == 401
@@ -9,7 +9,23 @@ Tests the full HTTP → Router stack for:
 Celery is mocked so no broker/worker is needed.
 """
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.router import TasksRouter
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def fake_async_result(monkeypatch) -> SimpleNamespace:
+    """以輕量 stub 取代 Router 使用的 Celery AsyncResult，測試只需設定其屬性。
+
+    需要驗證 revoke 呼叫的測試再自行換上 MagicMock。
+    """
+    stub = SimpleNamespace(status="PENDING", info=None, result=None, revoke=lambda **_kw: None)
+    monkeypatch.setattr(TasksRouter, "AsyncResult", lambda *_a, **_k: stub)
+    return stub
 
 
 # ---------------------------------------------------------------------------
@@ -19,116 +35,62 @@ from unittest.mock import MagicMock, patch
 class TestGetTaskStatus:
     """測試取得背景任務狀態。"""
 
-    def _mock_async_result(self, status: str, info=None, result=None):
-        """建立模擬的 Celery AsyncResult 物件。"""
-        mock_result = MagicMock()
-        mock_result.status = status
-        mock_result.info = info
-        mock_result.result = result
-        return mock_result
-
-    def test_pending_task_status(self, client):
-        """PENDING 狀態：無進度資訊。"""
-        mock_result = self._mock_async_result("PENDING")
-
-        with patch("app.router.TasksRouter.AsyncResult", return_value=mock_result):
-            resp = client.get("/tasks/status/fake-task-id-123")
+    @pytest.mark.parametrize(
+        "status, info, result, expected",
+        [
+            pytest.param(
+                "PENDING", None, None,
+                {"progress": None, "result": None, "error": None},
+                id="pending-no-progress",
+            ),
+            pytest.param(
+                "STARTED", None, None,
+                {"progress": None, "result": None, "error": None},
+                id="started-no-progress",
+            ),
+            pytest.param(
+                "REVOKED", None, None,
+                {"progress": None},
+                id="revoked-no-progress",
+            ),
+            pytest.param(
+                "PROGRESS",
+                {"current": 5, "total": 10, "percent": 50.0, "current_idno": "EMP005"},
+                None,
+                {"progress": {"current": 5, "total": 10, "percent": 50.0, "current_idno": "EMP005"}},
+                id="progress-includes-meta",
+            ),
+            pytest.param(
+                "SUCCESS", None, {"imported": 10, "failed": 0},
+                {"result": {"imported": 10, "failed": 0}, "progress": None},
+                id="success-includes-result",
+            ),
+            pytest.param(
+                "FAILURE", ValueError("Something went wrong"), None,
+                {"error": "Something went wrong", "progress": None},
+                id="failure-includes-error",
+            ),
+            pytest.param(
+                "FAILURE", None, None,
+                {"error": "Unknown error"},
+                id="failure-without-info",
+            ),
+        ],
+    )
+    async def test_task_status(self, async_client, fake_async_result, status, info, result, expected):
+        """各狀態回傳對應的 progress / result / error 欄位。"""
+        fake_async_result.status = status
+        fake_async_result.info = info
+        fake_async_result.result = result
+
+        resp = await async_client.get("/tasks/status/fake-task-id-123")
 
         assert resp.status_code == 200
         body = resp.json()
         assert body["task_id"] == "fake-task-id-123"
-        assert body["status"] == "PENDING"
-        assert body["progress"] is None
-        assert body["result"] is None
-        assert body["error"] is None
-
-    def test_progress_task_status(self, client):
-        """PROGRESS 狀態：包含進度資訊。"""
-        progress_meta = {
-            "current": 5,
-            "total": 10,
-            "percent": 50.0,
-            "current_idno": "EMP005",
-        }
-        mock_result = self._mock_async_result("PROGRESS", info=progress_meta)
-
-        with patch("app.router.TasksRouter.AsyncResult", return_value=mock_result):
-            resp = client.get("/tasks/status/progress-task-id")
-
-        assert resp.status_code == 200
-        body = resp.json()
-        assert body["status"] == "PROGRESS"
-        assert body["progress"]["current"] == 5
-        assert body["progress"]["total"] == 10
-        assert body["progress"]["percent"] == 50.0
-        assert body["progress"]["current_idno"] == "EMP005"
-
-    def test_success_task_status(self, client):
-        """SUCCESS 狀態：包含結果。"""
-        task_result = {"imported": 10, "failed": 0}
-        mock_result = self._mock_async_result("SUCCESS", result=task_result)
-        mock_result.result = task_result
-
-        with patch("app.router.TasksRouter.AsyncResult", return_value=mock_result):
-            resp = client.get("/tasks/status/success-task-id")
-
-        assert resp.status_code == 200
-        body = resp.json()
-        assert body["status"] == "SUCCESS"
-        assert body["result"] == task_result
-        assert body["progress"] is None
-
-    def test_failure_task_status(self, client):
-        """FAILURE 狀態：包含錯誤訊息。"""
-        mock_result = self._mock_async_result("FAILURE", info=ValueError("Something went wrong"))
-
-        with patch("app.router.TasksRouter.AsyncResult", return_value=mock_result):
-            resp = client.get("/tasks/status/failed-task-id")
-
-        assert resp.status_code == 200
-        body = resp.json()
-        assert body["status"] == "FAILURE"
-        assert body["error"] is not None
-        assert "Something went wrong" in body["error"]
-        assert body["progress"] is None
-
-    def test_failure_task_with_no_info(self, client):
-        """FAILURE 狀態但 info 為 None：回傳 'Unknown error'。"""
-        mock_result = self._mock_async_result("FAILURE", info=None)
-
-        with patch("app.router.TasksRouter.AsyncResult", return_value=mock_result):
-            resp = client.get("/tasks/status/no-info-task")
-
-        assert resp.status_code == 200
-        body = resp.json()
-        assert body["status"] == "FAILURE"
-        assert body["error"] == "Unknown error"
-
-    def test_started_task_status(self, client):
-        """STARTED 狀態：無進度和結果。"""
-        mock_result = self._mock_async_result("STARTED")
-
-        with patch("app.router.TasksRouter.AsyncResult", return_value=mock_result):
-            resp = client.get("/tasks/status/started-task-id")
-
-        assert resp.status_code == 200
-        body = resp.json()
-        assert body["status"] == "STARTED"
-        assert body["progress"] is None
-        assert body["result"] is None
-        assert body["error"] is None
-
-    def test_revoked_task_status(self, client):
-        """REVOKED 狀態：無進度和結果。"""
-        mock_result = self._mock_async_result("REVOKED")
-
-        with patch("app.router.TasksRouter.AsyncResult", return_value=mock_result):
-            resp = client.get("/tasks/status/revoked-task-id")
-
-        assert resp.status_code == 200
-        body = resp.json()
-        assert body["status"] == "REVOKED"
-        assert body["progress"] is None
+        assert body["status"] == status
+        for field, value in expected.items():
+            assert body[field] == value
 
 
 # ---------------------------------------------------------------------------
@@ -138,27 +100,22 @@ class TestGetTaskStatus:
 class TestCancelTask:
     """測試取消背景任務。"""
 
-    def test_cancel_task_returns_cancelled_true(self, client):
+    async def test_cancel_task_returns_cancelled_true(self, async_client, fake_async_result):
         """取消任務回傳 cancelled=True。"""
-        mock_result = MagicMock()
-        mock_result.revoke = MagicMock()
-
-        with patch("app.router.TasksRouter.AsyncResult", return_value=mock_result):
-            resp = client.delete("/tasks/cancel/task-to-cancel")
+        resp = await async_client.delete("/tasks/cancel/task-to-cancel")
 
         assert resp.status_code == 200
         body = resp.json()
         assert body["task_id"] == "task-to-cancel"
         assert body["cancelled"] is True
 
-    def test_cancel_calls_revoke_with_sigterm(self, client):
+    async def test_cancel_calls_revoke_with_sigterm(self, async_client, fake_async_result):
         """確認 revoke 以 SIGTERM 訊號觸發。"""
-        mock_result = MagicMock()
+        fake_async_result.revoke = MagicMock()
 
-        with patch("app.router.TasksRouter.AsyncResult", return_value=mock_result):
-            client.delete("/tasks/cancel/sigterm-task")
+        await async_client.delete("/tasks/cancel/sigterm-task")
 
-        mock_result.revoke.assert_called_once_with(terminate=True, signal="SIGTERM")
+        fake_async_result.revoke.assert_called_once_with(terminate=True, signal="SIGTERM")
 
 
 # ---------------------------------------------------------------------------
@@ -168,9 +125,9 @@ class TestCancelTask:
 class TestEnqueueDemoTask:
     """測試示範排程端點。"""
 
-    def test_enqueue_demo_task_returns_task_id(self, client):
+    async def test_enqueue_demo_task_returns_task_id(self, async_client):
         """呼叫 demo 端點會回傳 task_id。"""
-        resp = client.get("/tasks/add")
+        resp = await async_client.get("/tasks/add")
 
         assert resp.status_code == 200
         body = resp.json()
@@ -5,9 +5,20 @@ Integration tests: 使用者註冊、登入與受保護端點存取。
 僅 mock 外部服務（Email）。
 """
 import pytest
-from unittest.mock import AsyncMock, patch
 
-from tests.integration.conftest import get_auth_token, auth_headers
+from tests.integration.conftest import get_auth_token_async, auth_headers
+
+pytestmark = pytest.mark.asyncio
+
+# 合法註冊 payload 的欄位（不可變），各測試以 dict(_VALID_PAYLOAD_ITEMS, ...) 組出 payload
+_VALID_PAYLOAD_ITEMS = (
+    ("uid", "newuser"),
+    ("pwd", "Password1!"),
+    ("email", "newuser@test.com"),
+    ("name", "New User"),
+    ("birthdate", "1995-06-15"),
+    ("description", "Hello"),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -17,68 +28,31 @@ from tests.integration.conftest import get_auth_token, auth_headers
 class TestUserRegistration:
     """測試使用者註冊流程（UserService → UserRepository → DB）。"""
 
-    _VALID_PAYLOAD = {
-        "uid": "newuser",
-        "pwd": "Password1!",
-        "email": "newuser@test.com",
-        "name": "New User",
-        "birthdate": "1995-06-15",
-        "description": "Hello",
-    }
-
-    def test_register_success(self, client):
+    async def test_register_success(self, async_client, verification_email):
         """成功建立新使用者，並呼叫 email 驗證服務。"""
-        with patch(
-            "app.services.EmailService.EmailService.send_verification_email",
-            new=AsyncMock(),
-        ):
-            resp = client.post("/users/create", json=self._VALID_PAYLOAD)
+        resp = await async_client.post("/users/create", json=dict(_VALID_PAYLOAD_ITEMS))
 
         assert resp.status_code == 200
         assert "User created successfully" in resp.json()["message"]
-
-    def test_register_duplicate_uid_returns_409(self, client, seed_normal_user):
-        """使用已存在的 uid 建立使用者，回傳 409。"""
-        payload = {**self._VALID_PAYLOAD, "uid": seed_normal_user["uid"], "email": "unique@test.com"}
-        with patch(
-            "app.services.EmailService.EmailService.send_verification_email",
-            new=AsyncMock(),
-        ):
-            resp = client.post("/users/create", json=payload)
+        verification_email.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        "seed_fixture, conflict_field, overrides",
+        [
+            ("seed_normal_user", "uid", {"email": "unique@test.com"}),
+            ("seed_normal_user", "email", {"uid": "uniqueuid"}),
+            ("seed_unverified_user", "email", {"uid": "anotheruid"}),
+        ],
+        ids=["duplicate_uid", "verified_email", "unverified_email"],
+    )
+    async def test_register_conflict_returns_409(self, async_client, request, seed_fixture, conflict_field, overrides):
+        """使用已存在的 uid、已驗證或尚未驗證的 email 建立使用者，皆回傳 409。"""
+        seed = request.getfixturevalue(seed_fixture)
+        payload = dict(_VALID_PAYLOAD_ITEMS, **overrides, **{conflict_field: seed[conflict_field]})
+        resp = await async_client.post("/users/create", json=payload)
 
         assert resp.status_code == 409
 
-    def test_register_verified_email_returns_409(self, client, seed_normal_user):
-        """使用已驗證的 email 建立使用者，回傳 409。"""
-        payload = {**self._VALID_PAYLOAD, "uid": "uniqueuid", "email": seed_normal_user["email"]}
-        with patch(
-            "app.services.EmailService.EmailService.send_verification_email",
-            new=AsyncMock(),
-        ):
-            resp = client.post("/users/create", json=payload)
-
-        assert resp.status_code == 409
-
-    def test_register_unverified_email_returns_409(self, client, seed_unverified_user):
-        """使用已註冊但尚未驗證的 email，回傳 409 並說明需重送驗證信。"""
-        payload = {
-            **self._VALID_PAYLOAD,
-            "uid": "anotheruid",
-            "email": seed_unverified_user["email"],
-        }
-        with patch(
-            "app.services.EmailService.EmailService.send_verification_email",
-            new=AsyncMock(),
-        ):
-            resp = client.post("/users/create", json=payload)
-
-        assert resp.status_code == 409
-
-    def test_register_invalid_payload_returns_422(self, client):
-        """缺少必填欄位，回傳 422 Validation Error。"""
-        resp = client.post("/users/create", json={"uid": "only_uid"})
-        assert resp.status_code == 422
-
 
 # ---------------------------------------------------------------------------
 # POST /users/login
@@ -87,58 +61,34 @@ class TestUserRegistration:
 class TestLogin:
     """測試登入流程（AuthService → UserRepository → JWT）。"""
 
-    def test_login_with_uid_returns_token(self, client, seed_admin):
-        """使用 uid 登入成功，回傳 JWT token 及使用者資訊。"""
-        resp = client.post(
+    @pytest.mark.parametrize(
+        "seed_fixture, get_username, get_password, expected_status",
+        [
+            ("seed_admin", lambda s: s["uid"], lambda s: s["password"], 200),
+            ("seed_normal_user", lambda s: s["email"], lambda s: s["password"], 200),
+            ("seed_normal_user", lambda s: s["uid"], lambda s: "WrongPass999!", 401),
+            (None, lambda s: "ghost", lambda s: "anything", 401),
+            ("seed_unverified_user", lambda s: s["uid"], lambda s: s["password"], 403),
+        ],
+        ids=["uid", "email", "wrong_password", "nonexistent_user", "unverified_email"],
+    )
+    async def test_login(self, async_client, request, seed_fixture, get_username, get_password, expected_status):
+        """以 uid 或 email 登入成功回傳 token 及使用者資訊；密碼錯誤或帳號不存在回傳 401，
+        Email 尚未驗證回傳 403。
+        """
+        seed = request.getfixturevalue(seed_fixture) if seed_fixture else {}
+        resp = await async_client.post(
             "/users/login",
-            data={"username": seed_admin["uid"], "password": seed_admin["password"]},
+            data={"username": get_username(seed), "password": get_password(seed)},
         )
-        assert resp.status_code == 200
-        body = resp.json()
-        assert "access_token" in body
-        assert body["token_type"] == "bearer"
-        assert "expires_in" in body
-        assert body["user"]["uid"] == seed_admin["uid"]
-        assert body["user"]["role"] == "ADMIN"
-
-    def test_login_with_email_returns_token(self, client, seed_normal_user):
-        """使用 email 登入成功。"""
-        resp = client.post(
-            "/users/login",
-            data={
-                "username": seed_normal_user["email"],
-                "password": seed_normal_user["password"],
-            },
-        )
-        assert resp.status_code == 200
-        assert "access_token" in resp.json()
-
-    def test_login_wrong_password_returns_401(self, client, seed_normal_user):
-        """密碼錯誤，回傳 401。"""
-        resp = client.post(
-            "/users/login",
-            data={"username": seed_normal_user["uid"], "password": "WrongPass999!"},
-        )
-        assert resp.status_code == 401
-
-    def test_login_nonexistent_user_returns_401(self, client):
-        """帳號不存在，回傳 401。"""
-        resp = client.post(
-            "/users/login",
-            data={"username": "ghost", "password": "anything"},
-        )
-        assert resp.status_code == 401
-
-    def test_login_unverified_email_returns_403(self, client, seed_unverified_user):
-        """Email 尚未驗證的帳號登入，回傳 403。"""
-        resp = client.post(
-            "/users/login",
-            data={
-                "username": seed_unverified_user["uid"],
-                "password": seed_unverified_user["password"],
-            },
-        )
-        assert resp.status_code == 403
+        assert resp.status_code == expected_status
+        if expected_status == 200:
+            body = resp.json()
+            assert "access_token" in body
+            assert body["token_type"] == "bearer"
+            assert "expires_in" in body
+            assert body["user"]["uid"] == seed["uid"]
+            assert body["user"]["role"] == seed["role"].value
 
 
 # ---------------------------------------------------------------------------
@@ -148,10 +98,9 @@ class TestLogin:
 class TestGetMe:
     """測試取得當前使用者資訊（JWT 認證 → UserRepository）。"""
 
-    def test_get_me_with_valid_token(self, client, seed_normal_user):
+    async def test_get_me_with_valid_token(self, async_client, seed_normal_user, normal_user_headers):
         """有效 token 可取得自身資訊。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.get("/users/me", headers=auth_headers(token))
+        resp = await async_client.get("/users/me", headers=normal_user_headers)
 
         assert resp.status_code == 200
         body = resp.json()
@@ -160,20 +109,14 @@ class TestGetMe:
         assert body["role"] == "NORMAL"
         assert "profile" in body
 
-    def test_get_me_without_token_returns_401(self, client):
-        """未帶 token，回傳 401。"""
-        resp = client.get("/users/me")
-        assert resp.status_code == 401
-
-    def test_get_me_with_invalid_token_returns_401(self, client):
+    async def test_get_me_with_invalid_token_returns_401(self, async_client):
         """無效 token，回傳 401。"""
-        resp = client.get("/users/me", headers=auth_headers("invalid.token.here"))
+        resp = await async_client.get("/users/me", headers=auth_headers("invalid.token.here"))
         assert resp.status_code == 401
 
-    def test_admin_get_me_shows_admin_role(self, client, seed_admin):
+    async def test_admin_get_me_shows_admin_role(self, async_client, admin_headers):
         """Admin 取得自身資訊，role 為 ADMIN。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.get("/users/me", headers=auth_headers(token))
+        resp = await async_client.get("/users/me", headers=admin_headers)
 
         assert resp.status_code == 200
         assert resp.json()["role"] == "ADMIN"
@@ -186,10 +129,9 @@ class TestGetMe:
 class TestListUsers:
     """測試使用者列表端點（僅 Admin 可存取）。"""
 
-    def test_admin_can_list_users(self, client, seed_admin, seed_normal_user):
+    async def test_admin_can_list_users(self, async_client, seed_normal_user, admin_headers):
         """Admin 可取得使用者分頁列表，包含所有已建立的帳號。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.get("/users/?page=1&size=10", headers=auth_headers(token))
+        resp = await async_client.get("/users/?page=1&size=10", headers=admin_headers)
 
         assert resp.status_code == 200
         body = resp.json()
@@ -198,18 +140,12 @@ class TestListUsers:
         assert body["total"] >= 2  # admin + normal user
         assert body["page"] == 1
 
-    def test_normal_user_cannot_list_users(self, client, seed_normal_user):
+    async def test_normal_user_cannot_list_users(self, async_client, normal_user_headers):
         """一般使用者存取管理端點，回傳 403。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.get("/users/?page=1&size=10", headers=auth_headers(token))
+        resp = await async_client.get("/users/?page=1&size=10", headers=normal_user_headers)
 
         assert resp.status_code == 403
 
-    def test_list_users_unauthenticated_returns_401(self, client):
-        """未認證存取，回傳 401。"""
-        resp = client.get("/users/?page=1&size=10")
-        assert resp.status_code == 401
-
 
 # ---------------------------------------------------------------------------
 # GET /users/search
@@ -218,12 +154,11 @@ class TestListUsers:
 class TestSearchUsers:
     """測試搜尋使用者端點（所有已登入使用者皆可使用）。"""
 
-    def test_search_by_uid(self, client, seed_admin, seed_normal_user):
+    async def test_search_by_uid(self, async_client, seed_normal_user, admin_headers):
         """以 uid 關鍵字搜尋使用者。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.get(
+        resp = await async_client.get(
             f"/users/search?keyword={seed_normal_user['uid']}",
-            headers=auth_headers(token),
+            headers=admin_headers,
         )
 
         assert resp.status_code == 200
@@ -233,21 +168,15 @@ class TestSearchUsers:
         uids = [item["uid"] for item in body["items"]]
         assert seed_normal_user["uid"] in uids
 
-    def test_search_excludes_self(self, client, seed_admin, seed_normal_user):
+    async def test_search_excludes_self(self, async_client, seed_admin, seed_normal_user, admin_headers):
         """搜尋結果不包含自己。"""
-        token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        resp = client.get("/users/search?keyword=admin", headers=auth_headers(token))
+        resp = await async_client.get("/users/search?keyword=admin", headers=admin_headers)
 
         assert resp.status_code == 200
         # admin 搜尋自己，結果中不應有 admin
         uids = [item["uid"] for item in resp.json()["items"]]
         assert seed_admin["uid"] not in uids
 
-    def test_search_without_token_returns_401(self, client):
-        """未認證搜尋，回傳 401。"""
-        resp = client.get("/users/search?keyword=test")
-        assert resp.status_code == 401
-
 
 # ---------------------------------------------------------------------------
 # GET /users/me/login-records
@@ -256,10 +185,10 @@ class TestSearchUsers:
 class TestLoginRecords:
     """測試登入紀錄端點（登入後自動記錄）。"""
 
-    def test_my_login_records_after_login(self, client, seed_normal_user):
+    async def test_my_login_records_after_login(self, async_client, seed_normal_user):
         """登入後可查詢到自身的登入紀錄。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.get("/users/me/login-records", headers=auth_headers(token))
+        token = await get_auth_token_async(async_client, seed_normal_user["uid"], seed_normal_user["password"])
+        resp = await async_client.get("/users/me/login-records", headers=auth_headers(token))
 
         assert resp.status_code == 200
         body = resp.json()
@@ -277,37 +206,32 @@ class TestLoginRecords:
 class TestRegistrationSecurity:
     """安全測試：角色注入防護。"""
 
-    def test_cannot_register_as_admin_via_payload(self, client, seed_admin):
+    async def test_cannot_register_as_admin_via_payload(self, async_client, admin_headers):
         """安全測試：即使 payload 帶有 role=ADMIN，新使用者仍應被建立為 NORMAL。"""
-        with patch(
-            "app.services.EmailService.EmailService.send_verification_email",
-            new=AsyncMock(),
-        ):
-            resp = client.post("/users/create", json={
-                "uid": "attacker",
-                "pwd": "Password1!",
-                "email": "attacker@test.com",
-                "name": "Attacker",
-                "birthdate": "1990-01-01",
-                "description": "",
-                "role": "ADMIN",   # 嘗試注入 ADMIN role
-            })
+        resp = await async_client.post("/users/create", json={
+            "uid": "attacker",
+            "pwd": "Password1!",
+            "email": "attacker@test.com",
+            "name": "Attacker",
+            "birthdate": "1990-01-01",
+            "description": "",
+            "role": "ADMIN",   # 嘗試注入 ADMIN role
+        })
 
         # 建立成功（role 欄位被忽略）
         assert resp.status_code == 200
 
         # 用 admin token 查詢使用者列表，確認 attacker 的 role 是 NORMAL
-        admin_token = get_auth_token(client, seed_admin["uid"], seed_admin["password"])
-        search_resp = client.get(
+        search_resp = await async_client.get(
             "/users/search?keyword=attacker",
-            headers=auth_headers(admin_token),
+            headers=admin_headers,
         )
         assert search_resp.status_code == 200
         items = search_resp.json()["items"]
         assert any(u["uid"] == "attacker" for u in items)
 
         # 確認 attacker 登入後 role 是 NORMAL（必須先驗證 email，這裡直接查 /users/ 列表）
-        users_resp = client.get("/users/?page=1&size=100", headers=auth_headers(admin_token))
+        users_resp = await async_client.get("/users/?page=1&size=100", headers=admin_headers)
         users = users_resp.json()["items"]
         attacker = next((u for u in users if u["uid"] == "attacker"), None)
         assert attacker is not None
@@ -317,32 +241,31 @@ class TestRegistrationSecurity:
 class TestPasswordUpdateSecurity:
     """安全測試：密碼修改的 IDOR 防護（整合層）。"""
 
-    def test_update_password_requires_auth(self, client, seed_normal_user):
+    async def test_update_password_requires_auth(self, async_client, seed_normal_user):
         """未帶 token 修改密碼，回傳 401。"""
-        resp = client.post("/users/update", json={
+        resp = await async_client.post("/users/update", json={
             "user_id": seed_normal_user["id"],
             "old_password": seed_normal_user["password"],
             "new_password": "NewPass999!",
         })
         assert resp.status_code == 401
 
-    def test_update_password_other_user_returns_403(self, client, seed_normal_user, seed_admin):
+    async def test_update_password_other_user_returns_403(self, async_client, seed_admin, normal_user_headers):
         """嘗試修改他人密碼，回傳 403。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.post(
+        resp = await async_client.post(
             "/users/update",
             json={
                 "user_id": seed_admin["id"],   # admin 的 UUID
                 "old_password": "anything",
                 "new_password": "hacked!",
             },
-            headers=auth_headers(token),
+            headers=normal_user_headers,
         )
         assert resp.status_code == 403
 
-    def test_update_profile_requires_auth(self, client, seed_normal_user):
+    async def test_update_profile_requires_auth(self, async_client, seed_normal_user):
         """未帶 token 修改個人資料，回傳 401。"""
-        resp = client.post("/users/profile/update", json={
+        resp = await async_client.post("/users/profile/update", json={
             "user_id": seed_normal_user["id"],
             "name": "Hacker",
             "birthdate": "1990-01-01",
@@ -350,10 +273,9 @@ class TestPasswordUpdateSecurity:
         })
         assert resp.status_code == 401
 
-    def test_update_profile_other_user_returns_403(self, client, seed_normal_user, seed_admin):
+    async def test_update_profile_other_user_returns_403(self, async_client, seed_admin, normal_user_headers):
         """嘗試修改他人個人資料，回傳 403。"""
-        token = get_auth_token(client, seed_normal_user["uid"], seed_normal_user["password"])
-        resp = client.post(
+        resp = await async_client.post(
             "/users/profile/update",
             json={
                 "user_id": seed_admin["id"],   # admin 的 UUID
@@ -361,6 +283,6 @@ class TestPasswordUpdateSecurity:
                 "birthdate": "1990-01-01",
                 "description": "",
             },
-            headers=auth_headers(token),
+            headers=normal_user_headers,
         )
         assert resp.status_code == 403
@@ -0,0 +1,36 @@
+"""
+Shared fixtures and helpers for domain model unit tests.
+"""
+import re
+from datetime import datetime
+
+import pytest
+
+
+# uuid4() 經 str() 轉出的小寫 UUIDv4 格式，供各測試以 fullmatch 驗證產生的 id
+UUID4_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}")
+
+
+@pytest.fixture
+def freeze_datetime(monkeypatch):
+    """固定指定模組內的 datetime.now()，回傳值可精確比對而不依賴時鐘解析度。
+
+    用法：``freeze_datetime(module, frozen)`` 將 ``module.datetime`` 替換為
+    ``now()`` 固定回傳 ``frozen`` 的子類別，並回傳 ``frozen``。
+    ``now(tz)`` 與真實行為一致：naive 的 ``frozen`` 視為本地時間；
+    帶 tz 時轉換到該時區，不帶 tz 時回傳本地時間的 naive datetime。
+    """
+    def _freeze(module, frozen: datetime) -> datetime:
+        class _FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                if tz is not None:
+                    return frozen.astimezone(tz)
+                if frozen.tzinfo is None:
+                    return frozen
+                return frozen.astimezone().replace(tzinfo=None)
+
+        monkeypatch.setattr(module, "datetime", _FrozenDatetime)
+        return frozen
+
+    return _freeze
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 from datetime import datetime, timedelta, UTC
 from app.domain.ApprovalModel import (
@@ -18,11 +20,15 @@ TEST_APPROVER_2 = "33d200ac-48d8-4675-bfc0-a3a61af3c499"
 TEST_APPROVER_3 = "44d200ac-48d8-4675-bfc0-a3a61af3c499"
 
 
+LEAVE_START = datetime(2026, 3, 1, 9, 0, 0)
+LEAVE_END = datetime(2026, 3, 3, 18, 0, 0)
+
+
 def make_leave_detail() -> LeaveDetail:
     return LeaveDetail(
         leave_type=LeaveType.ANNUAL,
-        start_date=datetime(2026, 3, 1, 9, 0, 0),
-        end_date=datetime(2026, 3, 3, 18, 0, 0),
+        start_date=LEAVE_START,
+        end_date=LEAVE_END,
         reason="家庭旅遊",
     )
 
@@ -35,20 +41,38 @@ def make_expense_detail() -> ExpenseDetail:
     )
 
 
+@pytest.fixture(scope="class")
+def base_leave_request() -> ApprovalRequest:
+    """三關審批的請假申請原型，每個 class 只建立一次；唯讀測試可直接共用。"""
+    return ApprovalRequest.create_leave_request(
+        requester_id=TEST_REQUESTER_ID,
+        detail=make_leave_detail(),
+        approver_ids=[TEST_APPROVER_1, TEST_APPROVER_2, TEST_APPROVER_3],
+    )
+
+
+@pytest.fixture
+def leave_request(base_leave_request: ApprovalRequest) -> ApprovalRequest:
+    """base_leave_request 的獨立副本，供會改變審批狀態的測試使用。"""
+    return copy.deepcopy(base_leave_request)
+
+
 class TestLeaveDetail:
     """測試 LeaveDetail 值物件"""
 
     def test_create_valid_leave_detail(self):
         detail = make_leave_detail()
         assert detail.leave_type == LeaveType.ANNUAL
+        assert detail.start_date == LEAVE_START
+        assert detail.end_date == LEAVE_END
         assert detail.reason == "家庭旅遊"
 
     def test_leave_detail_invalid_date_range(self):
         with pytest.raises(ValueError, match="Start date must be before end date"):
             LeaveDetail(
                 leave_type=LeaveType.SICK,
-                start_date=datetime(2026, 3, 3),
-                end_date=datetime(2026, 3, 1),
+                start_date=LEAVE_END,
+                end_date=LEAVE_START,
                 reason="生病",
             )
 
@@ -56,20 +80,11 @@ class TestLeaveDetail:
         with pytest.raises(ValueError, match="Reason cannot be empty"):
             LeaveDetail(
                 leave_type=LeaveType.PERSONAL,
-                start_date=datetime(2026, 3, 1),
-                end_date=datetime(2026, 3, 2),
+                start_date=LEAVE_START,
+                end_date=LEAVE_END,
                 reason="   ",
             )
 
-    def test_leave_detail_to_dict_and_from_dict(self):
-        detail = make_leave_detail()
-        d = detail.to_dict()
-        restored = LeaveDetail.from_dict(d)
-        assert restored.leave_type == detail.leave_type
-        assert restored.start_date == detail.start_date
-        assert restored.end_date == detail.end_date
-        assert restored.reason == detail.reason
-
 
 class TestExpenseDetail:
     """測試 ExpenseDetail 值物件"""
@@ -91,13 +106,18 @@ class TestExpenseDetail:
         with pytest.raises(ValueError, match="Category cannot be empty"):
             ExpenseDetail(amount=100, category="", description="test")
 
-    def test_expense_detail_to_dict_and_from_dict(self):
-        detail = make_expense_detail()
-        d = detail.to_dict()
-        restored = ExpenseDetail.from_dict(d)
-        assert restored.amount == detail.amount
-        assert restored.category == detail.category
-        assert restored.description == detail.description
+
+class TestDetailRoundTrip:
+    """測試明細值物件 to_dict / from_dict 來回轉換（frozen dataclass，可直接比較相等）"""
+
+    @pytest.mark.parametrize(
+        "factory, cls",
+        [(make_leave_detail, LeaveDetail), (make_expense_detail, ExpenseDetail)],
+        ids=["leave", "expense"],
+    )
+    def test_to_dict_and_from_dict(self, factory, cls):
+        detail = factory()
+        assert cls.from_dict(detail.to_dict()) == detail
 
 
 class TestApprovalStep:
@@ -172,14 +192,8 @@ class TestApprovalRequestCreation:
                 approver_ids=[],
             )
 
-    def test_current_step_returns_first_pending(self):
-        detail = make_leave_detail()
-        request = ApprovalRequest.create_leave_request(
-            requester_id=TEST_REQUESTER_ID,
-            detail=detail,
-            approver_ids=[TEST_APPROVER_1, TEST_APPROVER_2],
-        )
-        current = request.current_step()
+    def test_current_step_returns_first_pending(self, base_leave_request):
+        current = base_leave_request.current_step()
         assert current is not None
         assert current.step_order == 1
         assert current.approver_id == TEST_APPROVER_1
@@ -188,43 +202,32 @@ class TestApprovalRequestCreation:
 class TestApprovalRequestApproval:
     """測試逐級審批流程"""
 
-    def _make_request(self) -> ApprovalRequest:
-        return ApprovalRequest.create_leave_request(
-            requester_id=TEST_REQUESTER_ID,
-            detail=make_leave_detail(),
-            approver_ids=[TEST_APPROVER_1, TEST_APPROVER_2, TEST_APPROVER_3],
-        )
+    def test_approve_first_step(self, leave_request):
+        leave_request.approve(TEST_APPROVER_1, "第一關通過")
 
-    def test_approve_first_step(self):
-        request = self._make_request()
-        request.approve(TEST_APPROVER_1, "第一關通過")
-
-        assert request.status == ApprovalStatus.PENDING  # still pending
-        assert request.steps[0].status == ApprovalStatus.APPROVED
-        current = request.current_step()
+        assert leave_request.status == ApprovalStatus.PENDING  # still pending
+        assert leave_request.steps[0].status == ApprovalStatus.APPROVED
+        current = leave_request.current_step()
         assert current.step_order == 2
         assert current.approver_id == TEST_APPROVER_2
 
-    def test_approve_all_steps_completes_request(self):
-        request = self._make_request()
-        request.approve(TEST_APPROVER_1)
-        request.approve(TEST_APPROVER_2)
-        request.approve(TEST_APPROVER_3)
+    def test_approve_all_steps_completes_request(self, leave_request):
+        leave_request.approve(TEST_APPROVER_1)
+        leave_request.approve(TEST_APPROVER_2)
+        leave_request.approve(TEST_APPROVER_3)
 
-        assert request.status == ApprovalStatus.APPROVED
-        assert request.is_completed()
-        assert request.current_step() is None
+        assert leave_request.status == ApprovalStatus.APPROVED
+        assert leave_request.is_completed()
+        assert leave_request.current_step() is None
 
-    def test_wrong_approver_raises_error(self):
-        request = self._make_request()
+    def test_wrong_approver_raises_error(self, leave_request):
         with pytest.raises(ValueError, match="not the approver"):
-            request.approve(TEST_APPROVER_2)  # should be APPROVER_1
+            leave_request.approve(TEST_APPROVER_2)  # should be APPROVER_1
 
-    def test_cannot_approve_non_pending_request(self):
-        request = self._make_request()
-        request.reject(TEST_APPROVER_1, "駁回")
+    def test_cannot_approve_non_pending_request(self, leave_request):
+        leave_request.reject(TEST_APPROVER_1, "駁回")
         with pytest.raises(ValueError, match="Can only approve a pending request"):
-            request.approve(TEST_APPROVER_1)
+            leave_request.approve(TEST_APPROVER_1)
 
 
 class TestApprovalRequestRejection:
@@ -323,7 +326,8 @@ class TestApprovalRequestReconstitute:
         assert reconstituted.id == original.id
         assert reconstituted.type == original.type
         assert reconstituted.status == original.status
-        assert len(reconstituted.steps) == len(original.steps)
+        assert reconstituted.detail == original.detail
+        assert reconstituted.steps == original.steps
 
 
 class TestDetailDict:
@@ -335,10 +339,12 @@ class TestDetailDict:
             detail=make_leave_detail(),
             approver_ids=[TEST_APPROVER_1],
         )
-        d = request.detail_dict()
-        assert d['leave_type'] == 'ANNUAL'
-        assert 'start_date' in d
-        assert 'reason' in d
+        assert request.detail_dict() == {
+            'leave_type': 'ANNUAL',
+            'start_date': LEAVE_START.isoformat(),
+            'end_date': LEAVE_END.isoformat(),
+            'reason': '家庭旅遊',
+        }
 
     def test_expense_detail_dict(self):
         request = ApprovalRequest.create_expense_request(
@@ -346,6 +352,9 @@ class TestDetailDict:
             detail=make_expense_detail(),
             approver_ids=[TEST_APPROVER_1],
         )
-        d = request.detail_dict()
-        assert d['amount'] == 1500.0
-        assert d['category'] == '交通費'
+        assert request.detail_dict() == {
+            'amount': 1500.0,
+            'category': '交通費',
+            'description': '出差計程車費',
+            'receipt_url': None,
+        }
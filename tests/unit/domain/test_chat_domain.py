@@ -1,11 +1,13 @@
 """
 Unit tests for ChatModel domain objects.
 """
+from dataclasses import FrozenInstanceError
+
 import pytest
 from datetime import datetime, timezone
-from uuid import UUID
 
 from app.domain.ChatModel import ConversationModel, ChatMessageModel
+from tests.unit.domain.conftest import UUID4_RE
 
 
 # --- Test Data ---
@@ -60,7 +62,7 @@ class TestChatMessageModel:
             role="user",
             content="Hello",
         )
-        with pytest.raises(Exception):  # FrozenInstanceError
+        with pytest.raises(FrozenInstanceError):
             msg.content = "Modified"
 
 
@@ -71,10 +73,7 @@ class TestConversationModel:
         conv = ConversationModel.create(user_id=TEST_USER_ID)
 
         assert conv.id is not None
-        try:
-            UUID(conv.id, version=4)
-        except ValueError:
-            pytest.fail("Conversation ID should be a valid UUIDv4")
+        assert UUID4_RE.fullmatch(conv.id), "Conversation ID should be a valid UUIDv4"
         assert conv.user_id == TEST_USER_ID
         assert conv.title is None
         assert conv.messages == []
@@ -26,13 +26,18 @@ class TestEmployeeCsvRow:
         assert row.uid == 'john'
         assert row.role_id == 1
 
-    def test_from_dict_case_insensitive_department(self):
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            ({**VALID_ROW, 'department': 'hr'}, Department.HR),
+            ({**VALID_ROW, 'department': 'Rd'}, Department.RD),
+        ],
+        ids=["lowercase", "mixed_case"],
+    )
+    def test_from_dict_case_insensitive_department(self, data, expected):
         """測試部門字串不區分大小寫"""
-        row = EmployeeCsvRow.from_dict({**VALID_ROW, 'department': 'hr'})
-        assert row.department == Department.HR
-
-        row2 = EmployeeCsvRow.from_dict({**VALID_ROW, 'department': 'Rd'})
-        assert row2.department == Department.RD
+        row = EmployeeCsvRow.from_dict(data)
+        assert row.department == expected
 
     def test_from_dict_strips_whitespace(self):
         """測試所有欄位會自動去除前後空白"""
@@ -49,50 +54,43 @@ class TestEmployeeCsvRow:
         assert row.uid == 'testuser'
         assert row.role_id == 2
 
-    def test_from_dict_optional_role_id_empty(self):
-        """測試 role_id 為空字串時設為 None"""
-        row = EmployeeCsvRow.from_dict({**VALID_ROW, 'role_id': ''})
-        assert row.role_id is None
-
-    def test_from_dict_optional_role_id_none(self):
-        """測試 role_id 為 None 時設為 None"""
-        row = EmployeeCsvRow.from_dict({**VALID_ROW, 'role_id': None})
-        assert row.role_id is None
-
-    def test_from_dict_optional_role_id_present(self):
-        """測試 role_id 為有效數字字串時正確轉換"""
-        row = EmployeeCsvRow.from_dict({**VALID_ROW, 'role_id': '5'})
-        assert row.role_id == 5
-
-    def test_from_dict_missing_idno_raises(self):
-        """測試缺少 idno 時拋出 ValueError"""
-        with pytest.raises(ValueError, match='idno is required'):
-            EmployeeCsvRow.from_dict({**VALID_ROW, 'idno': ''})
-
-    def test_from_dict_missing_department_raises(self):
-        """測試缺少 department 時拋出 ValueError"""
-        with pytest.raises(ValueError, match='department is required'):
-            EmployeeCsvRow.from_dict({**VALID_ROW, 'department': ''})
-
-    def test_from_dict_missing_email_raises(self):
-        """測試缺少 email 時拋出 ValueError"""
-        with pytest.raises(ValueError, match='email is required'):
-            EmployeeCsvRow.from_dict({**VALID_ROW, 'email': ''})
-
-    def test_from_dict_missing_uid_raises(self):
-        """測試缺少 uid 時拋出 ValueError"""
-        with pytest.raises(ValueError, match='uid is required'):
-            EmployeeCsvRow.from_dict({**VALID_ROW, 'uid': ''})
-
-    def test_from_dict_invalid_department_raises(self):
-        """測試無效部門名稱時拋出 ValueError"""
-        with pytest.raises(ValueError, match='Invalid department'):
-            EmployeeCsvRow.from_dict({**VALID_ROW, 'department': 'INVALID'})
-
-    def test_from_dict_invalid_role_id_raises(self):
-        """測試無效 role_id 時拋出 ValueError"""
-        with pytest.raises(ValueError, match='Invalid role_id'):
-            EmployeeCsvRow.from_dict({**VALID_ROW, 'role_id': 'abc'})
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            ({**VALID_ROW, 'role_id': ''}, None),
+            ({**VALID_ROW, 'role_id': None}, None),
+            ({**VALID_ROW, 'role_id': '5'}, 5),
+        ],
+        ids=["empty", "none", "present"],
+    )
+    def test_from_dict_optional_role_id(self, data, expected):
+        """測試 role_id 為空字串或 None 時設為 None，為有效數字字串時正確轉換"""
+        row = EmployeeCsvRow.from_dict(data)
+        assert row.role_id == expected
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            ({**VALID_ROW, 'idno': ''}, 'idno is required'),
+            ({**VALID_ROW, 'department': ''}, 'department is required'),
+            ({**VALID_ROW, 'email': ''}, 'email is required'),
+            ({**VALID_ROW, 'uid': ''}, 'uid is required'),
+            ({**VALID_ROW, 'department': 'INVALID'}, 'Invalid department'),
+            ({**VALID_ROW, 'role_id': 'abc'}, 'Invalid role_id'),
+        ],
+        ids=[
+            "missing_idno",
+            "missing_department",
+            "missing_email",
+            "missing_uid",
+            "invalid_department",
+            "invalid_role_id",
+        ],
+    )
+    def test_from_dict_invalid_raises(self, data, message):
+        """測試缺少必填欄位、無效部門名稱或無效 role_id 時拋出 ValueError"""
+        with pytest.raises(ValueError, match=message):
+            EmployeeCsvRow.from_dict(data)
 
     def test_frozen_immutability(self):
         """測試 EmployeeCsvRow 為不可變物件"""
@@ -1,5 +1,8 @@
+import copy
+
 import pytest
 from datetime import datetime
+import app.domain.EmployeeModel as employee_model_module
 from app.domain.EmployeeModel import EmployeeModel, Department, RoleInfo
 
 
@@ -10,45 +13,68 @@ TEST_ROLE_ID = 1
 TEST_ROLE_NAME = "Senior Developer"
 TEST_ROLE_LEVEL = 5
 TEST_AUTHORITIES = ["USER_READ", "USER_WRITE", "PROJECT_READ"]
+FROZEN_NOW = datetime(2026, 1, 2, 3, 4, 5)
 
 
-def test_employee_creation_with_valid_data():
-    """
-    測試使用有效資料建立員工實體。
-    """
-    employee = EmployeeModel.create(
-        idno=TEST_IDNO,
-        department=TEST_DEPARTMENT
+@pytest.fixture
+def frozen_now(freeze_datetime):
+    """固定 EmployeeModel 內的 datetime.now()，updated_at 可精確比對而不依賴時鐘解析度。"""
+    return freeze_datetime(employee_model_module, FROZEN_NOW)
+
+
+@pytest.fixture(scope="module")
+def base_employee():
+    """整個模組共用的員工原型（唯讀）；會修改狀態的測試請使用 fresh_employee。"""
+    return EmployeeModel.create(idno=TEST_IDNO, department=TEST_DEPARTMENT)
+
+
+@pytest.fixture(scope="module")
+def employee_with_role(base_employee):
+    """已分配角色的員工（唯讀）。"""
+    employee = copy.copy(base_employee)
+    employee.assign_role(
+        role_id=TEST_ROLE_ID,
+        role_name=TEST_ROLE_NAME,
+        role_level=TEST_ROLE_LEVEL,
+        authorities=TEST_AUTHORITIES
     )
+    return employee
 
-    # 斷言物件型別正確
-    assert isinstance(employee, EmployeeModel)
 
-    # 斷言屬性符合預期
-    assert employee.id is None  # ID should be None before persistence
-    assert employee.idno == TEST_IDNO
-    assert employee.department == TEST_DEPARTMENT
-    assert employee.role is None
-    assert isinstance(employee.created_at, datetime)
-    assert employee.updated_at is None
+@pytest.fixture
+def fresh_employee(base_employee):
+    """base_employee 的淺複製，供會修改狀態的測試使用。"""
+    return copy.copy(base_employee)
 
 
-def test_employee_creation_with_string_department():
+def test_employee_creation_with_valid_data(base_employee):
     """
-    測試使用字串形式的部門建立員工。
+    測試使用有效資料建立員工實體。
     """
-    employee = EmployeeModel.create(idno=TEST_IDNO, department="hr")
+    # 斷言物件型別正確
+    assert isinstance(base_employee, EmployeeModel)
 
-    assert employee.department == Department.HR
+    # 斷言屬性符合預期
+    assert base_employee.id is None  # ID should be None before persistence
+    assert base_employee.idno == TEST_IDNO
+    assert base_employee.department == TEST_DEPARTMENT
+    assert base_employee.role is None
+    assert isinstance(base_employee.created_at, datetime)
+    assert base_employee.updated_at is None
 
 
-def test_employee_creation_with_uppercase_string_department():
+@pytest.mark.parametrize(
+    "department, expected",
+    [("hr", Department.HR), ("RD", Department.RD)],
+    ids=["lowercase", "uppercase"],
+)
+def test_employee_creation_with_string_department(department, expected):
     """
-    測試使用大寫字串形式的部門建立員工。
+    測試使用字串形式（不分大小寫）的部門建立員工。
     """
-    employee = EmployeeModel.create(idno=TEST_IDNO, department="RD")
+    employee = EmployeeModel.create(idno=TEST_IDNO, department=department)
 
-    assert employee.department == Department.RD
+    assert employee.department == expected
 
 
 def test_employee_creation_with_empty_idno_raises_error():
@@ -79,13 +105,11 @@ def test_employee_idno_is_stripped():
     assert employee.idno == "EMP002"
 
 
-def test_employee_assign_role():
+def test_employee_assign_role(fresh_employee, frozen_now):
     """
     測試分配角色給員工。
     """
-    employee = EmployeeModel.create(idno=TEST_IDNO, department=TEST_DEPARTMENT)
-
-    employee.assign_role(
+    fresh_employee.assign_role(
         role_id=TEST_ROLE_ID,
         role_name=TEST_ROLE_NAME,
         role_level=TEST_ROLE_LEVEL,
@@ -93,92 +117,61 @@ def test_employee_assign_role():
     )
 
     # 斷言角色已正確分配
-    assert employee.role is not None
-    assert isinstance(employee.role, RoleInfo)
-    assert employee.role.id == TEST_ROLE_ID
-    assert employee.role.name == TEST_ROLE_NAME
-    assert employee.role.level == TEST_ROLE_LEVEL
-    assert employee.role.authorities == TEST_AUTHORITIES
+    assert fresh_employee.role is not None
+    assert isinstance(fresh_employee.role, RoleInfo)
+    assert fresh_employee.role.id == TEST_ROLE_ID
+    assert fresh_employee.role.name == TEST_ROLE_NAME
+    assert fresh_employee.role.level == TEST_ROLE_LEVEL
+    assert fresh_employee.role.authorities == TEST_AUTHORITIES
 
     # 斷言 updated_at 已被設定
-    assert employee.updated_at is not None
-    assert isinstance(employee.updated_at, datetime)
+    assert fresh_employee.updated_at == frozen_now
 
 
-def test_employee_change_department_with_enum():
+@pytest.mark.parametrize(
+    "department, expected",
+    [(Department.HR, Department.HR), ("bd", Department.BD)],
+    ids=["enum", "string"],
+)
+def test_employee_change_department(fresh_employee, frozen_now, department, expected):
     """
-    測試使用枚舉類型變更員工部門。
+    測試使用枚舉或字串變更員工部門。
     """
-    employee = EmployeeModel.create(idno=TEST_IDNO, department=TEST_DEPARTMENT)
-    original_updated_at = employee.updated_at
+    fresh_employee.change_department(department)
 
-    employee.change_department(Department.HR)
+    assert fresh_employee.department == expected
+    assert fresh_employee.updated_at == frozen_now
 
-    assert employee.department == Department.HR
-    assert employee.updated_at != original_updated_at
-    assert isinstance(employee.updated_at, datetime)
 
-
-def test_employee_change_department_with_string():
-    """
-    測試使用字串變更員工部門。
-    """
-    employee = EmployeeModel.create(idno=TEST_IDNO, department=TEST_DEPARTMENT)
-
-    employee.change_department("bd")
-
-    assert employee.department == Department.BD
-
-
-def test_employee_change_department_with_invalid_string_raises_error():
+def test_employee_change_department_with_invalid_string_raises_error(fresh_employee):
     """
     測試使用無效的部門字串變更部門時會拋出 ValueError。
     """
-    employee = EmployeeModel.create(idno=TEST_IDNO, department=TEST_DEPARTMENT)
-
     with pytest.raises(ValueError, match="Invalid department"):
-        employee.change_department("INVALID")
+        fresh_employee.change_department("INVALID")
 
 
-def test_employee_has_authority_returns_true_when_authority_exists():
+def test_employee_has_authority_returns_true_when_authority_exists(employee_with_role):
     """
     測試員工擁有特定權限時 has_authority 返回 True。
     """
-    employee = EmployeeModel.create(idno=TEST_IDNO, department=TEST_DEPARTMENT)
-    employee.assign_role(
-        role_id=TEST_ROLE_ID,
-        role_name=TEST_ROLE_NAME,
-        role_level=TEST_ROLE_LEVEL,
-        authorities=TEST_AUTHORITIES
-    )
-
-    assert employee.has_authority("USER_READ") is True
-    assert employee.has_authority("USER_WRITE") is True
-    assert employee.has_authority("PROJECT_READ") is True
+    assert employee_with_role.has_authority("USER_READ") is True
+    assert employee_with_role.has_authority("USER_WRITE") is True
+    assert employee_with_role.has_authority("PROJECT_READ") is True
 
 
-def test_employee_has_authority_returns_false_when_authority_not_exists():
+def test_employee_has_authority_returns_false_when_authority_not_exists(employee_with_role):
     """
     測試員工沒有特定權限時 has_authority 返回 False。
     """
-    employee = EmployeeModel.create(idno=TEST_IDNO, department=TEST_DEPARTMENT)
-    employee.assign_role(
-        role_id=TEST_ROLE_ID,
-        role_name=TEST_ROLE_NAME,
-        role_level=TEST_ROLE_LEVEL,
-        authorities=TEST_AUTHORITIES
-    )
+    assert employee_with_role.has_authority("ADMIN_ACCESS") is False
 
-    assert employee.has_authority("ADMIN_ACCESS") is False
 
-
-def test_employee_has_authority_returns_false_when_no_role():
+def test_employee_has_authority_returns_false_when_no_role(base_employee):
     """
     測試員工沒有角色時 has_authority 返回 False。
     """
-    employee = EmployeeModel.create(idno=TEST_IDNO, department=TEST_DEPARTMENT)
-
-    assert employee.has_authority("USER_READ") is False
+    assert base_employee.has_authority("USER_READ") is False
 
 
 def test_employee_equality_by_idno():
@@ -1,11 +1,10 @@
 """
 Unit tests for LoginRecordModel domain model.
 """
-import pytest
 from datetime import datetime
-from uuid import UUID
 
 from app.domain.LoginRecordModel import LoginRecordModel
+from tests.unit.domain.conftest import UUID4_RE
 
 
 # --- Test Data ---
@@ -30,10 +29,7 @@ class TestLoginRecordCreate:
 
         assert isinstance(record, LoginRecordModel)
         # ID 應為有效 UUID
-        try:
-            UUID(record.id, version=4)
-        except ValueError:
-            pytest.fail("LoginRecordModel.id should be a valid UUIDv4 string")
+        assert UUID4_RE.fullmatch(record.id), "LoginRecordModel.id should be a valid UUIDv4 string"
 
         assert record.username == TEST_USERNAME
         assert record.ip_address == TEST_IP
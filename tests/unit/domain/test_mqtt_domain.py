@@ -1,6 +1,7 @@
 import pytest
 from datetime import datetime, timezone
 
+import app.domain.MQTTModel as mqtt_model_module
 from app.domain.MQTTModel import MQTTMessageModel
 
 
@@ -8,6 +9,13 @@ from app.domain.MQTTModel import MQTTMessageModel
 TEST_TOPIC = "test/hello"
 TEST_PAYLOAD = "Hello MQTT"
 TEST_QOS = 1
+FROZEN_NOW = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def frozen_now(freeze_datetime):
+    """固定 MQTTModel 內的 datetime.now()，received_at 可精確比對而不依賴時鐘解析度。"""
+    return freeze_datetime(mqtt_model_module, FROZEN_NOW)
 
 
 class TestMQTTMessageModelCreation:
@@ -30,15 +38,14 @@ class TestMQTTMessageModelCreation:
         assert message.id is None
         assert message.received_at is not None
 
-    def test_create_sets_received_at_to_utc_now(self):
+    def test_create_sets_received_at_to_utc_now(self, frozen_now):
         """
         測試建立訊息時 received_at 設為 UTC 時間。
         """
-        before = datetime.now(timezone.utc)
         message = MQTTMessageModel.create(topic=TEST_TOPIC, payload=TEST_PAYLOAD)
-        after = datetime.now(timezone.utc)
 
-        assert before <= message.received_at <= after
+        assert message.received_at == frozen_now
+        assert message.received_at.utcoffset() == timezone.utc.utcoffset(None)
 
     def test_create_with_default_qos(self):
         """
@@ -91,24 +98,27 @@ class TestMQTTMessageModelReconstitute:
 class TestMQTTMessageModelProperties:
     """測試 MQTTMessageModel 屬性為唯讀"""
 
-    def test_properties_are_readonly(self):
-        """
-        測試所有屬性為唯讀。
-        """
-        message = MQTTMessageModel.create(
+    @pytest.fixture(scope="class")
+    def message(self):
+        """屬性皆為唯讀，整個類別共用同一則訊息。"""
+        return MQTTMessageModel.create(
             topic=TEST_TOPIC,
             payload=TEST_PAYLOAD,
             qos=TEST_QOS,
         )
 
+    @pytest.mark.parametrize(
+        "attr,value",
+        [
+            ("topic", "other/topic"),
+            ("payload", "other"),
+            ("qos", 2),
+            ("received_at", FROZEN_NOW),
+        ],
+    )
+    def test_property_is_readonly(self, message, attr, value):
+        """
+        測試屬性為唯讀。
+        """
         with pytest.raises(AttributeError):
-            message.topic = "other/topic"
-
-        with pytest.raises(AttributeError):
-            message.payload = "other"
-
-        with pytest.raises(AttributeError):
-            message.qos = 2
-
-        with pytest.raises(AttributeError):
-            message.received_at = datetime.now(timezone.utc)
+            setattr(message, attr, value)
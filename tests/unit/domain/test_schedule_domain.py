@@ -1,12 +1,16 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 from datetime import datetime, timedelta, timezone
-from uuid import UUID
+
+import app.domain.ScheduleModel as schedule_model_module
 from app.domain.ScheduleModel import (
     ScheduleModel,
     TimeRange,
     GoogleSyncInfo,
     ScheduleCreator,
 )
+from tests.unit.domain.conftest import UUID4_RE
 
 
 # --- Test Data ---
@@ -15,13 +19,47 @@ TEST_DESCRIPTION = "Weekly team sync meeting"
 TEST_LOCATION = "Conference Room A"
 TEST_CREATOR_ID = "11d200ac-48d8-4675-bfc0-a3a61af3c499"
 TEST_TIMEZONE = "Asia/Taipei"
+# 有效的時間範圍（開始時間在結束時間之前）
+VALID_START = datetime(2024, 1, 15, 9, 0, 0)
+VALID_END = datetime(2024, 1, 15, 10, 0, 0)
+_CREATED_AT = datetime(2024, 1, 10, 8, 0, 0, tzinfo=timezone.utc)
+FROZEN_NOW = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+# reconstitute 共用參數；各測試只覆寫有差異的欄位
+_BASE_RECON = dict(
+    all_day=False,
+    timezone=TEST_TIMEZONE,
+    creator_id=TEST_CREATOR_ID,
+    description=None,
+    location=None,
+    google_event_id=None,
+    synced_at=None,
+    created_at=_CREATED_AT,
+    updated_at=None,
+)
+
 
+@pytest.fixture
+def frozen_now(freeze_datetime):
+    """固定 ScheduleModel 內的 datetime.now()，時間欄位可精確比對而不依賴時鐘解析度。"""
+    return freeze_datetime(schedule_model_module, FROZEN_NOW)
 
-def get_valid_time_range() -> tuple[datetime, datetime]:
-    """取得有效的時間範圍（開始時間在結束時間之前）"""
-    start = datetime(2024, 1, 15, 9, 0, 0)
-    end = datetime(2024, 1, 15, 10, 0, 0)
-    return start, end
+
+@pytest.fixture
+def make_schedule():
+    """以預設標題、有效時間範圍與建立者建立排程的工廠；關鍵字參數可覆寫任一欄位。"""
+
+    def _make(**overrides) -> ScheduleModel:
+        kwargs = dict(
+            title=TEST_TITLE,
+            start_time=VALID_START,
+            end_time=VALID_END,
+            creator_id=TEST_CREATOR_ID,
+        )
+        kwargs.update(overrides)
+        return ScheduleModel.create(**kwargs)
+
+    return _make
 
 
 class TestTimeRange:
@@ -31,16 +69,15 @@ class TestTimeRange:
         """
         測試使用有效時間範圍建立 TimeRange。
         """
-        start, end = get_valid_time_range()
         time_range = TimeRange(
-            start_time=start,
-            end_time=end,
+            start_time=VALID_START,
+            end_time=VALID_END,
             all_day=False,
             timezone=TEST_TIMEZONE
         )
 
-        assert time_range.start_time == start
-        assert time_range.end_time == end
+        assert time_range.start_time == VALID_START
+        assert time_range.end_time == VALID_END
         assert time_range.all_day is False
         assert time_range.timezone == TEST_TIMEZONE
 
@@ -48,30 +85,24 @@ class TestTimeRange:
         """
         測試 TimeRange 的預設值。
         """
-        start, end = get_valid_time_range()
-        time_range = TimeRange(start_time=start, end_time=end)
+        time_range = TimeRange(start_time=VALID_START, end_time=VALID_END)
 
         assert time_range.all_day is False
         assert time_range.timezone == "Asia/Taipei"
 
-    def test_time_range_with_invalid_range_raises_error(self):
+    @pytest.mark.parametrize(
+        "end_delta",
+        [timedelta(hours=-1), timedelta(0)],
+        ids=["end_before_start", "equal_times"],
+    )
+    def test_time_range_with_invalid_range_raises_error(self, end_delta):
         """
-        測試開始時間在結束時間之後會拋出 ValueError。
+        測試結束時間早於或等於開始時間會拋出 ValueError。
         """
         start = datetime(2024, 1, 15, 10, 0, 0)
-        end = datetime(2024, 1, 15, 9, 0, 0)  # 結束時間早於開始時間
 
         with pytest.raises(ValueError, match="Start time must be before end time"):
-            TimeRange(start_time=start, end_time=end)
-
-    def test_time_range_with_equal_times_raises_error(self):
-        """
-        測試開始時間等於結束時間會拋出 ValueError。
-        """
-        same_time = datetime(2024, 1, 15, 9, 0, 0)
-
-        with pytest.raises(ValueError, match="Start time must be before end time"):
-            TimeRange(start_time=same_time, end_time=same_time)
+            TimeRange(start_time=start, end_time=start + end_delta)
 
     def test_time_range_all_day_event(self):
         """
@@ -91,20 +122,18 @@ class TestTimeRange:
         """
         測試 TimeRange 是不可變的（frozen dataclass）。
         """
-        start, end = get_valid_time_range()
-        time_range = TimeRange(start_time=start, end_time=end)
+        time_range = TimeRange(start_time=VALID_START, end_time=VALID_END)
 
-        with pytest.raises(Exception):  # FrozenInstanceError
-            time_range.start_time = datetime.now()
+        with pytest.raises(FrozenInstanceError):
+            time_range.start_time = FROZEN_NOW
 
     def test_time_range_equality(self):
         """
         測試 TimeRange 的相等性比較。
         """
-        start, end = get_valid_time_range()
-        range1 = TimeRange(start_time=start, end_time=end, timezone="Asia/Taipei")
-        range2 = TimeRange(start_time=start, end_time=end, timezone="Asia/Taipei")
-        range3 = TimeRange(start_time=start, end_time=end, timezone="UTC")
+        range1 = TimeRange(start_time=VALID_START, end_time=VALID_END, timezone="Asia/Taipei")
+        range2 = TimeRange(start_time=VALID_START, end_time=VALID_END, timezone="Asia/Taipei")
+        range3 = TimeRange(start_time=VALID_START, end_time=VALID_END, timezone="UTC")
 
         assert range1 == range2
         assert range1 != range3
@@ -127,14 +156,13 @@ class TestGoogleSyncInfo:
         """
         測試有 event_id 的 GoogleSyncInfo。
         """
-        now = datetime.now(timezone.utc)
         sync_info = GoogleSyncInfo(
             event_id="google_event_123",
-            synced_at=now
+            synced_at=FROZEN_NOW
         )
 
         assert sync_info.event_id == "google_event_123"
-        assert sync_info.synced_at == now
+        assert sync_info.synced_at == FROZEN_NOW
         assert sync_info.is_synced is True
 
     def test_google_sync_info_is_synced_property(self):
@@ -153,7 +181,7 @@ class TestGoogleSyncInfo:
         """
         sync_info = GoogleSyncInfo()
 
-        with pytest.raises(Exception):
+        with pytest.raises(FrozenInstanceError):
             sync_info.event_id = "new_id"
 
 
@@ -184,23 +212,18 @@ class TestScheduleCreator:
             email="test@example.com"
         )
 
-        with pytest.raises(Exception):
+        with pytest.raises(FrozenInstanceError):
             creator.username = "newuser"
 
 
 class TestScheduleModelCreation:
     """測試 ScheduleModel 建立功能"""
 
-    def test_schedule_creation_with_valid_data(self):
+    def test_schedule_creation_with_valid_data(self, make_schedule):
         """
         測試使用有效資料建立排程。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID,
+        schedule = make_schedule(
             description=TEST_DESCRIPTION,
             location=TEST_LOCATION,
             timezone=TEST_TIMEZONE
@@ -210,83 +233,45 @@ class TestScheduleModelCreation:
         assert schedule.title == TEST_TITLE
         assert schedule.description == TEST_DESCRIPTION
         assert schedule.location == TEST_LOCATION
-        assert schedule.start_time == start
-        assert schedule.end_time == end
+        assert schedule.start_time == VALID_START
+        assert schedule.end_time == VALID_END
         assert schedule.creator_id == TEST_CREATOR_ID
         assert schedule.timezone == TEST_TIMEZONE
         assert schedule.all_day is False
 
-    def test_schedule_creation_generates_uuid(self):
+    def test_schedule_creation_generates_uuid(self, make_schedule):
         """
         測試建立排程會生成有效的 UUID。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
-        try:
-            UUID(schedule.id, version=4)
-        except ValueError:
-            pytest.fail("ScheduleModel.id should be a valid UUIDv4 string")
+        assert UUID4_RE.fullmatch(schedule.id), "ScheduleModel.id should be a valid UUIDv4 string"
 
-    def test_schedule_creation_generates_unique_ids(self):
+    def test_schedule_creation_generates_unique_ids(self, make_schedule):
         """
         測試每次建立都會生成唯一的 ID。
         """
-        start, end = get_valid_time_range()
-        schedule1 = ScheduleModel.create(
-            title="Schedule 1",
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
-        schedule2 = ScheduleModel.create(
-            title="Schedule 2",
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule1 = make_schedule(title="Schedule 1")
+        schedule2 = make_schedule(title="Schedule 2")
 
         assert schedule1.id != schedule2.id
 
-    def test_schedule_creation_with_empty_title_raises_error(self):
+    @pytest.mark.parametrize("bad_title", ["", "   "], ids=["empty", "blank"])
+    def test_schedule_creation_with_empty_title_raises_error(self, make_schedule, bad_title):
         """
         測試使用空白標題建立排程會拋出 ValueError。
         """
-        start, end = get_valid_time_range()
-
-        with pytest.raises(ValueError, match="Title cannot be empty"):
-            ScheduleModel.create(
-                title="",
-                start_time=start,
-                end_time=end,
-                creator_id=TEST_CREATOR_ID
-            )
-
         with pytest.raises(ValueError, match="Title cannot be empty"):
-            ScheduleModel.create(
-                title="   ",
-                start_time=start,
-                end_time=end,
-                creator_id=TEST_CREATOR_ID
-            )
+            make_schedule(title=bad_title)
 
-    def test_schedule_creation_strips_whitespace(self):
+    def test_schedule_creation_strips_whitespace(self, make_schedule):
         """
         測試建立排程時會自動去除前後空白。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
+        schedule = make_schedule(
             title="  Team Meeting  ",
             description="  Weekly sync  ",
-            location="  Room A  ",
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
+            location="  Room A  "
         )
 
         assert schedule.title == "Team Meeting"
@@ -308,22 +293,13 @@ class TestScheduleModelCreation:
                 creator_id=TEST_CREATOR_ID
             )
 
-    def test_schedule_creation_sets_created_at(self):
+    def test_schedule_creation_sets_created_at(self, make_schedule, frozen_now):
         """
         測試建立排程會設定 created_at。
         """
-        start, end = get_valid_time_range()
-        before = datetime.now(timezone.utc)
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
-        after = datetime.now(timezone.utc)
+        schedule = make_schedule()
 
-        assert schedule.created_at is not None
-        assert before <= schedule.created_at <= after
+        assert schedule.created_at == frozen_now
         assert schedule.updated_at is None
 
     def test_schedule_creation_with_all_day(self):
@@ -342,32 +318,20 @@ class TestScheduleModelCreation:
 
         assert schedule.all_day is True
 
-    def test_schedule_creation_with_optional_fields_none(self):
+    def test_schedule_creation_with_optional_fields_none(self, make_schedule):
         """
         測試建立排程時可選欄位為 None。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
         assert schedule.description is None
         assert schedule.location is None
 
-    def test_schedule_google_sync_initially_not_synced(self):
+    def test_schedule_google_sync_initially_not_synced(self, make_schedule):
         """
         測試新建立的排程尚未同步到 Google。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
         assert schedule.google_event_id is None
         assert schedule.synced_at is None
@@ -381,7 +345,6 @@ class TestScheduleModelReconstitute:
         """
         測試從持久化資料重建排程。
         """
-        start, end = get_valid_time_range()
         created_at = datetime(2024, 1, 10, 8, 0, 0)
         updated_at = datetime(2024, 1, 12, 10, 0, 0)
         synced_at = datetime(2024, 1, 12, 10, 5, 0)
@@ -391,8 +354,8 @@ class TestScheduleModelReconstitute:
             title=TEST_TITLE,
             description=TEST_DESCRIPTION,
             location=TEST_LOCATION,
-            start_time=start,
-            end_time=end,
+            start_time=VALID_START,
+            end_time=VALID_END,
             all_day=False,
             timezone=TEST_TIMEZONE,
             creator_id=TEST_CREATOR_ID,
@@ -406,8 +369,8 @@ class TestScheduleModelReconstitute:
         assert schedule.title == TEST_TITLE
         assert schedule.description == TEST_DESCRIPTION
         assert schedule.location == TEST_LOCATION
-        assert schedule.start_time == start
-        assert schedule.end_time == end
+        assert schedule.start_time == VALID_START
+        assert schedule.end_time == VALID_END
         assert schedule.all_day is False
         assert schedule.timezone == TEST_TIMEZONE
         assert schedule.creator_id == TEST_CREATOR_ID
@@ -420,7 +383,6 @@ class TestScheduleModelReconstitute:
         """
         測試重建排程時包含建立者資訊。
         """
-        start, end = get_valid_time_range()
         creator = ScheduleCreator(
             user_id=TEST_CREATOR_ID,
             username="testuser",
@@ -430,18 +392,10 @@ class TestScheduleModelReconstitute:
         schedule = ScheduleModel.reconstitute(
             id="test-uuid",
             title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            all_day=False,
-            timezone=TEST_TIMEZONE,
-            creator_id=TEST_CREATOR_ID,
-            description=None,
-            location=None,
-            google_event_id=None,
-            synced_at=None,
-            created_at=datetime.now(timezone.utc),
-            updated_at=None,
-            creator=creator
+            start_time=VALID_START,
+            end_time=VALID_END,
+            creator=creator,
+            **_BASE_RECON,
         )
 
         assert schedule.creator is not None
@@ -453,31 +407,19 @@ class TestScheduleModelReconstitute:
 class TestScheduleModelCanEdit:
     """測試排程編輯權限"""
 
-    def test_can_edit_returns_true_for_creator(self):
+    def test_can_edit_returns_true_for_creator(self, make_schedule):
         """
         測試建立者可以編輯排程。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
         assert schedule.can_edit(TEST_CREATOR_ID) is True
 
-    def test_can_edit_returns_false_for_other_user(self):
+    def test_can_edit_returns_false_for_other_user(self, make_schedule):
         """
         測試非建立者無法編輯排程。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
         other_user_id = "other-user-uuid"
         assert schedule.can_edit(other_user_id) is False
@@ -486,86 +428,43 @@ class TestScheduleModelCanEdit:
 class TestScheduleModelUpdate:
     """測試排程更新功能"""
 
-    def test_update_title(self):
+    @pytest.mark.parametrize(
+        "field,initial,value",
+        [
+            ("title", TEST_TITLE, "New Title"),
+            ("description", "Old description", "New description"),
+            ("location", "Old location", "New location"),
+            ("all_day", False, True),
+            ("timezone", "Asia/Taipei", "UTC"),
+        ],
+        ids=["title", "description", "location", "all_day", "timezone"],
+    )
+    def test_update_single_field(self, make_schedule, field, initial, value):
         """
-        測試更新排程標題。
+        測試更新單一欄位（標題、描述、地點、全天事件標記、時區）。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule(**{field: initial})
 
-        schedule.update(title="New Title")
+        schedule.update(**{field: value})
 
-        assert schedule.title == "New Title"
+        assert getattr(schedule, field) == value
         assert schedule.updated_at is not None
 
-    def test_update_with_empty_title_raises_error(self):
+    @pytest.mark.parametrize("bad_title", ["", "   "], ids=["empty", "blank"])
+    def test_update_with_empty_title_raises_error(self, make_schedule, bad_title):
         """
         測試使用空白標題更新會拋出 ValueError。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
-
-        with pytest.raises(ValueError, match="Title cannot be empty"):
-            schedule.update(title="")
+        schedule = make_schedule()
 
         with pytest.raises(ValueError, match="Title cannot be empty"):
-            schedule.update(title="   ")
-
-    def test_update_description(self):
-        """
-        測試更新排程描述。
-        """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID,
-            description="Old description"
-        )
-
-        schedule.update(description="New description")
-
-        assert schedule.description == "New description"
-
-    def test_update_location(self):
-        """
-        測試更新排程地點。
-        """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID,
-            location="Old location"
-        )
-
-        schedule.update(location="New location")
-
-        assert schedule.location == "New location"
+            schedule.update(title=bad_title)
 
-    def test_update_time_range(self):
+    def test_update_time_range(self, make_schedule):
         """
         測試更新排程時間範圍。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
         new_start = datetime(2024, 1, 20, 14, 0, 0)
         new_end = datetime(2024, 1, 20, 15, 0, 0)
@@ -574,17 +473,11 @@ class TestScheduleModelUpdate:
         assert schedule.start_time == new_start
         assert schedule.end_time == new_end
 
-    def test_update_with_invalid_time_range_raises_error(self):
+    def test_update_with_invalid_time_range_raises_error(self, make_schedule):
         """
         測試使用無效時間範圍更新會拋出 ValueError。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
         invalid_start = datetime(2024, 1, 20, 16, 0, 0)
         invalid_end = datetime(2024, 1, 20, 14, 0, 0)  # 結束時間早於開始時間
@@ -592,52 +485,11 @@ class TestScheduleModelUpdate:
         with pytest.raises(ValueError, match="Start time must be before end time"):
             schedule.update(start_time=invalid_start, end_time=invalid_end)
 
-    def test_update_all_day(self):
-        """
-        測試更新全天事件標記。
-        """
-        start = datetime(2024, 1, 15, 0, 0, 0)
-        end = datetime(2024, 1, 16, 0, 0, 0)
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID,
-            all_day=False
-        )
-
-        schedule.update(all_day=True)
-
-        assert schedule.all_day is True
-
-    def test_update_timezone(self):
-        """
-        測試更新時區。
-        """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID,
-            timezone="Asia/Taipei"
-        )
-
-        schedule.update(timezone="UTC")
-
-        assert schedule.timezone == "UTC"
-
-    def test_update_multiple_fields(self):
+    def test_update_multiple_fields(self, make_schedule):
         """
         測試同時更新多個欄位。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
         schedule.update(
             title="Updated Title",
@@ -649,42 +501,27 @@ class TestScheduleModelUpdate:
         assert schedule.description == "Updated Description"
         assert schedule.location == "Updated Location"
 
-    def test_update_sets_updated_at(self):
+    def test_update_sets_updated_at(self, make_schedule, frozen_now):
         """
         測試更新會設定 updated_at。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
         assert schedule.updated_at is None
 
-        before = datetime.now(timezone.utc)
         schedule.update(title="New Title")
-        after = datetime.now(timezone.utc)
 
-        assert schedule.updated_at is not None
-        assert before <= schedule.updated_at <= after
+        assert schedule.updated_at == frozen_now
 
 
 class TestScheduleModelGoogleSync:
     """測試排程 Google Calendar 同步功能"""
 
-    def test_mark_synced_sets_google_event_id(self):
+    def test_mark_synced_sets_google_event_id(self, make_schedule):
         """
         測試標記為已同步會設定 Google event ID。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
         schedule.mark_synced("google_event_456")
 
@@ -692,51 +529,31 @@ class TestScheduleModelGoogleSync:
         assert schedule.synced_at is not None
         assert schedule.google_sync.is_synced is True
 
-    def test_mark_synced_updates_synced_at(self):
+    def test_mark_synced_updates_synced_at(self, make_schedule, frozen_now):
         """
         測試標記為已同步會更新 synced_at。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
-        before = datetime.now(timezone.utc)
         schedule.mark_synced("google_event_789")
-        after = datetime.now(timezone.utc)
 
-        assert before <= schedule.synced_at <= after
+        assert schedule.synced_at == frozen_now
 
-    def test_mark_synced_sets_updated_at(self):
+    def test_mark_synced_sets_updated_at(self, make_schedule):
         """
         測試標記為已同步會設定 updated_at。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
 
         schedule.mark_synced("google_event_123")
 
         assert schedule.updated_at is not None
 
-    def test_clear_sync_removes_google_info(self):
+    def test_clear_sync_removes_google_info(self, make_schedule):
         """
         測試清除同步資訊。
         """
-        start, end = get_valid_time_range()
-        schedule = ScheduleModel.create(
-            title=TEST_TITLE,
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
+        schedule = make_schedule()
         schedule.mark_synced("google_event_123")
 
         schedule.clear_sync()
@@ -749,116 +566,44 @@ class TestScheduleModelGoogleSync:
 class TestScheduleModelEquality:
     """測試排程相等性"""
 
-    def test_schedule_equality_by_id(self):
+    @pytest.fixture(scope="class")
+    def schedules(self):
         """
-        測試排程相等性基於 ID 判斷。
+        建立一次、整個類別共用的三筆排程（唯讀）：
+        前兩筆 ID 相同但標題不同，第三筆 ID 不同。
         """
-        start, end = get_valid_time_range()
-        schedule1 = ScheduleModel.reconstitute(
-            id="same-id",
-            title="Title 1",
-            start_time=start,
-            end_time=end,
-            all_day=False,
-            timezone=TEST_TIMEZONE,
-            creator_id=TEST_CREATOR_ID,
-            description=None,
-            location=None,
-            google_event_id=None,
-            synced_at=None,
-            created_at=datetime.now(timezone.utc),
-            updated_at=None
-        )
-        schedule2 = ScheduleModel.reconstitute(
-            id="same-id",
-            title="Title 2",  # 不同標題
-            start_time=start,
-            end_time=end,
-            all_day=False,
-            timezone=TEST_TIMEZONE,
-            creator_id=TEST_CREATOR_ID,
-            description=None,
-            location=None,
-            google_event_id=None,
-            synced_at=None,
-            created_at=datetime.now(timezone.utc),
-            updated_at=None
-        )
-        schedule3 = ScheduleModel.reconstitute(
-            id="different-id",
-            title="Title 1",
-            start_time=start,
-            end_time=end,
-            all_day=False,
-            timezone=TEST_TIMEZONE,
-            creator_id=TEST_CREATOR_ID,
-            description=None,
-            location=None,
-            google_event_id=None,
-            synced_at=None,
-            created_at=datetime.now(timezone.utc),
-            updated_at=None
+        def _reconstitute(id: str, title: str) -> ScheduleModel:
+            return ScheduleModel.reconstitute(
+                id=id, title=title, start_time=VALID_START, end_time=VALID_END, **_BASE_RECON
+            )
+
+        return (
+            _reconstitute("same-id", "Title 1"),
+            _reconstitute("same-id", "Title 2"),  # 不同標題
+            _reconstitute("different-id", "Title 1"),
         )
 
+    def test_schedule_equality_by_id(self, schedules):
+        """
+        測試排程相等性基於 ID 判斷。
+        """
+        schedule1, schedule2, schedule3 = schedules
+
         assert schedule1 == schedule2  # 相同 ID 應該相等
         assert schedule1 != schedule3  # 不同 ID 應該不相等
 
-    def test_schedule_hash_consistency(self):
+    def test_schedule_hash_consistency(self, schedules):
         """
         測試排程雜湊值一致性。
         """
-        start, end = get_valid_time_range()
-        schedule1 = ScheduleModel.reconstitute(
-            id="same-id",
-            title="Title 1",
-            start_time=start,
-            end_time=end,
-            all_day=False,
-            timezone=TEST_TIMEZONE,
-            creator_id=TEST_CREATOR_ID,
-            description=None,
-            location=None,
-            google_event_id=None,
-            synced_at=None,
-            created_at=datetime.now(timezone.utc),
-            updated_at=None
-        )
-        schedule2 = ScheduleModel.reconstitute(
-            id="same-id",
-            title="Title 2",
-            start_time=start,
-            end_time=end,
-            all_day=False,
-            timezone=TEST_TIMEZONE,
-            creator_id=TEST_CREATOR_ID,
-            description=None,
-            location=None,
-            google_event_id=None,
-            synced_at=None,
-            created_at=datetime.now(timezone.utc),
-            updated_at=None
-        )
+        schedule1, schedule2, _ = schedules
 
         assert hash(schedule1) == hash(schedule2)
 
-    def test_schedule_can_be_used_in_set(self):
+    def test_schedule_can_be_used_in_set(self, schedules):
         """
-        測試排程可以用於集合操作。
+        測試排程可以用於集合操作：相同 ID 的排程只保留一筆。
         """
-        start, end = get_valid_time_range()
-        schedule1 = ScheduleModel.create(
-            title="Schedule 1",
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
-        schedule2 = ScheduleModel.create(
-            title="Schedule 2",
-            start_time=start,
-            end_time=end,
-            creator_id=TEST_CREATOR_ID
-        )
-
-        schedule_set = {schedule1, schedule2}
+        schedule_set = set(schedules)
 
         assert len(schedule_set) == 2
@@ -1,9 +1,10 @@
 """
 Unit tests for SSO domain models.
 """
+from dataclasses import FrozenInstanceError
+
 import pytest
 from datetime import datetime
-from uuid import UUID
 
 from app.domain.SSOModel import (
     SSOProtocol,
@@ -14,11 +15,14 @@ from app.domain.SSOModel import (
     SSOGlobalConfig,
     SSOUserLink,
 )
+from tests.unit.domain.conftest import UUID4_RE
 
 
 # --- Test Data ---
 TEST_PROVIDER_NAME = "Okta"
 TEST_PROVIDER_SLUG = "okta"
+_CREATED_AT = datetime(2024, 1, 1)
+_UPDATED_AT = datetime(2024, 6, 1)
 
 SAML_CONFIG_DATA = {
     "idp_entity_id": "https://okta.example.com/saml",
@@ -35,19 +39,54 @@ OIDC_CONFIG_DATA = {
     "token_url": "https://okta.example.com/token",
 }
 
+SSO_USER_LINK_DATA = {
+    "id": "link-1",
+    "user_id": "user-1",
+    "provider_id": "provider-1",
+    "external_id": "ext-id-123",
+}
 
-class TestSSOProtocol:
-    """測試 SSOProtocol 列舉"""
 
-    def test_saml_value(self):
-        assert SSOProtocol.SAML.value == "SAML"
+@pytest.fixture(scope="module")
+def saml_config():
+    """整個模組共用的 SAMLConfig（frozen dataclass，可安全共用）。"""
+    return SAMLConfig(**SAML_CONFIG_DATA)
+
+
+@pytest.fixture(scope="module")
+def oidc_config():
+    """整個模組共用的 OIDCConfig（frozen dataclass，可安全共用）。"""
+    return OIDCConfig(**OIDC_CONFIG_DATA)
+
 
-    def test_oidc_value(self):
-        assert SSOProtocol.OIDC.value == "OIDC"
+@pytest.fixture
+def make_provider(saml_config):
+    """以預設名稱、slug 與 SAML 設定建立 provider 的工廠；關鍵字參數可覆寫任一欄位。"""
+
+    def _make(**overrides) -> SSOProviderModel:
+        kwargs = dict(
+            name="Test",
+            slug="test",
+            protocol=SSOProtocol.SAML,
+            saml_config=saml_config,
+        )
+        kwargs.update(overrides)
+        return SSOProviderModel.create(**kwargs)
+
+    return _make
+
+
+class TestSSOProtocol:
+    """測試 SSOProtocol 列舉"""
 
-    def test_from_string(self):
-        assert SSOProtocol("SAML") == SSOProtocol.SAML
-        assert SSOProtocol("OIDC") == SSOProtocol.OIDC
+    @pytest.mark.parametrize(
+        "member,value",
+        [(SSOProtocol.SAML, "SAML"), (SSOProtocol.OIDC, "OIDC")],
+        ids=["saml", "oidc"],
+    )
+    def test_value_round_trip(self, member, value):
+        assert member.value == value
+        assert SSOProtocol(value) is member
 
 
 class TestSAMLConfig:
@@ -66,11 +105,6 @@ class TestSAMLConfig:
         config = SAMLConfig(**SAML_CONFIG_DATA, idp_slo_url="https://okta.example.com/slo")
         assert config.idp_slo_url == "https://okta.example.com/slo"
 
-    def test_is_frozen(self):
-        config = SAMLConfig(**SAML_CONFIG_DATA)
-        with pytest.raises(AttributeError):
-            config.idp_entity_id = "changed"
-
 
 class TestOIDCConfig:
     """測試 OIDCConfig 值物件"""
@@ -96,11 +130,6 @@ class TestOIDCConfig:
         assert config.jwks_uri == "https://okta.example.com/jwks"
         assert config.scopes == "openid email"
 
-    def test_is_frozen(self):
-        config = OIDCConfig(**OIDC_CONFIG_DATA)
-        with pytest.raises(AttributeError):
-            config.client_id = "changed"
-
 
 class TestAttributeMapping:
     """測試 AttributeMapping 值物件"""
@@ -137,145 +166,114 @@ class TestAttributeMapping:
 class TestSSOProviderModel:
     """測試 SSOProviderModel 聚合根"""
 
-    def test_create_saml_provider(self):
-        saml = SAMLConfig(**SAML_CONFIG_DATA)
-        provider = SSOProviderModel.create(
-            name=TEST_PROVIDER_NAME,
-            slug=TEST_PROVIDER_SLUG,
-            protocol=SSOProtocol.SAML,
-            saml_config=saml,
-        )
+    def test_create_saml_provider(self, make_provider, saml_config):
+        provider = make_provider(name=TEST_PROVIDER_NAME, slug=TEST_PROVIDER_SLUG)
 
         assert provider.name == TEST_PROVIDER_NAME
         assert provider.slug == TEST_PROVIDER_SLUG
         assert provider.protocol == SSOProtocol.SAML
-        assert provider.saml_config == saml
+        assert provider.saml_config == saml_config
         assert provider.oidc_config is None
         assert provider.is_active is False
         assert provider.display_order == 0
-        assert UUID(provider.id)  # valid UUID
+        assert UUID4_RE.fullmatch(provider.id), "SSOProviderModel.id should be a valid UUIDv4 string"
         assert provider.created_at is not None
 
-    def test_create_oidc_provider(self):
-        oidc = OIDCConfig(**OIDC_CONFIG_DATA)
+    def test_create_oidc_provider(self, oidc_config):
         provider = SSOProviderModel.create(
             name="Azure AD",
             slug="azure-ad",
             protocol=SSOProtocol.OIDC,
-            oidc_config=oidc,
+            oidc_config=oidc_config,
         )
 
         assert provider.protocol == SSOProtocol.OIDC
-        assert provider.oidc_config == oidc
+        assert provider.oidc_config == oidc_config
         assert provider.saml_config is None
 
-    def test_create_with_empty_name_raises(self):
-        saml = SAMLConfig(**SAML_CONFIG_DATA)
-        with pytest.raises(ValueError, match="Provider name cannot be empty"):
-            SSOProviderModel.create(name="", slug="test", protocol=SSOProtocol.SAML, saml_config=saml)
-
-    def test_create_with_empty_slug_raises(self):
-        saml = SAMLConfig(**SAML_CONFIG_DATA)
-        with pytest.raises(ValueError, match="Provider slug cannot be empty"):
-            SSOProviderModel.create(name="Test", slug="", protocol=SSOProtocol.SAML, saml_config=saml)
-
-    def test_create_saml_without_config_raises(self):
-        with pytest.raises(ValueError, match="SAML configuration is required"):
-            SSOProviderModel.create(name="Test", slug="test", protocol=SSOProtocol.SAML)
-
-    def test_create_oidc_without_config_raises(self):
-        with pytest.raises(ValueError, match="OIDC configuration is required"):
-            SSOProviderModel.create(name="Test", slug="test", protocol=SSOProtocol.OIDC)
-
-    def test_slug_is_lowercased(self):
-        saml = SAMLConfig(**SAML_CONFIG_DATA)
-        provider = SSOProviderModel.create(
-            name="Test", slug="My-Provider", protocol=SSOProtocol.SAML, saml_config=saml
-        )
+    @pytest.mark.parametrize(
+        "overrides,msg",
+        [
+            ({"name": ""}, "Provider name cannot be empty"),
+            ({"slug": ""}, "Provider slug cannot be empty"),
+            ({"saml_config": None}, "SAML configuration is required"),
+            ({"protocol": SSOProtocol.OIDC, "saml_config": None}, "OIDC configuration is required"),
+        ],
+        ids=["empty_name", "empty_slug", "saml_without_config", "oidc_without_config"],
+    )
+    def test_create_validation_raises(self, make_provider, overrides, msg):
+        with pytest.raises(ValueError, match=msg):
+            make_provider(**overrides)
+
+    def test_slug_is_lowercased(self, make_provider):
+        provider = make_provider(slug="My-Provider")
         assert provider.slug == "my-provider"
 
-    def test_reconstitute(self):
+    def test_reconstitute(self, saml_config):
         provider = SSOProviderModel.reconstitute(
             id="abc-123",
             name=TEST_PROVIDER_NAME,
             slug=TEST_PROVIDER_SLUG,
             protocol=SSOProtocol.SAML,
-            saml_config=SAMLConfig(**SAML_CONFIG_DATA),
+            saml_config=saml_config,
             is_active=True,
             display_order=1,
-            created_at=datetime(2024, 1, 1),
-            updated_at=datetime(2024, 6, 1),
+            created_at=_CREATED_AT,
+            updated_at=_UPDATED_AT,
         )
 
         assert provider.id == "abc-123"
         assert provider.is_active is True
         assert provider.display_order == 1
-        assert provider.created_at == datetime(2024, 1, 1)
-        assert provider.updated_at == datetime(2024, 6, 1)
+        assert provider.created_at == _CREATED_AT
+        assert provider.updated_at == _UPDATED_AT
 
-    def test_update_name(self):
-        saml = SAMLConfig(**SAML_CONFIG_DATA)
-        provider = SSOProviderModel.create(
-            name="Old Name", slug="test", protocol=SSOProtocol.SAML, saml_config=saml
-        )
+    def test_update_name(self, make_provider):
+        provider = make_provider(name="Old Name")
         provider.update(name="New Name")
         assert provider.name == "New Name"
         assert provider.updated_at is not None
 
-    def test_update_empty_name_raises(self):
-        saml = SAMLConfig(**SAML_CONFIG_DATA)
-        provider = SSOProviderModel.create(
-            name="Test", slug="test", protocol=SSOProtocol.SAML, saml_config=saml
-        )
+    @pytest.mark.parametrize("bad_name", ["", "  "], ids=["empty", "blank"])
+    def test_update_empty_name_raises(self, make_provider, bad_name):
+        provider = make_provider()
         with pytest.raises(ValueError, match="Provider name cannot be empty"):
-            provider.update(name="  ")
+            provider.update(name=bad_name)
 
-    def test_update_saml_config(self):
-        saml = SAMLConfig(**SAML_CONFIG_DATA)
-        provider = SSOProviderModel.create(
-            name="Test", slug="test", protocol=SSOProtocol.SAML, saml_config=saml
-        )
+    def test_update_saml_config(self, make_provider):
+        provider = make_provider()
         new_saml = SAMLConfig(**{**SAML_CONFIG_DATA, "idp_sso_url": "https://new.example.com/sso"})
         provider.update(saml_config=new_saml)
         assert provider.saml_config.idp_sso_url == "https://new.example.com/sso"
 
-    def test_update_display_order(self):
-        saml = SAMLConfig(**SAML_CONFIG_DATA)
-        provider = SSOProviderModel.create(
-            name="Test", slug="test", protocol=SSOProtocol.SAML, saml_config=saml
-        )
+    def test_update_display_order(self, make_provider):
+        provider = make_provider()
         provider.update(display_order=5)
         assert provider.display_order == 5
 
-    def test_activate(self):
-        saml = SAMLConfig(**SAML_CONFIG_DATA)
-        provider = SSOProviderModel.create(
-            name="Test", slug="test", protocol=SSOProtocol.SAML, saml_config=saml
-        )
+    def test_activate(self, make_provider):
+        provider = make_provider()
         provider.activate()
         assert provider.is_active is True
 
-    def test_activate_already_active_raises(self):
+    def test_activate_already_active_raises(self, saml_config):
         provider = SSOProviderModel.reconstitute(
             id="abc", name="Test", slug="test", protocol=SSOProtocol.SAML,
-            saml_config=SAMLConfig(**SAML_CONFIG_DATA), is_active=True,
+            saml_config=saml_config, is_active=True,
         )
         with pytest.raises(ValueError, match="already active"):
             provider.activate()
 
-    def test_deactivate(self):
+    def test_deactivate(self, saml_config):
         provider = SSOProviderModel.reconstitute(
             id="abc", name="Test", slug="test", protocol=SSOProtocol.SAML,
-            saml_config=SAMLConfig(**SAML_CONFIG_DATA), is_active=True,
+            saml_config=saml_config, is_active=True,
         )
         provider.deactivate()
         assert provider.is_active is False
 
-    def test_deactivate_already_inactive_raises(self):
-        saml = SAMLConfig(**SAML_CONFIG_DATA)
-        provider = SSOProviderModel.create(
-            name="Test", slug="test", protocol=SSOProtocol.SAML, saml_config=saml
-        )
+    def test_deactivate_already_inactive_raises(self, make_provider):
+        provider = make_provider()
         with pytest.raises(ValueError, match="already inactive"):
             provider.deactivate()
 
@@ -295,6 +293,7 @@ class TestSSOProviderModel:
             id="abc", name="B", slug="b", protocol=SSOProtocol.OIDC,
         )
         assert p1 == p2
+        assert hash(p1) == hash(p2)
 
     def test_inequality(self):
         p1 = SSOProviderModel.reconstitute(
@@ -305,15 +304,6 @@ class TestSSOProviderModel:
         )
         assert p1 != p2
 
-    def test_hash(self):
-        p1 = SSOProviderModel.reconstitute(
-            id="abc", name="A", slug="a", protocol=SSOProtocol.SAML,
-        )
-        p2 = SSOProviderModel.reconstitute(
-            id="abc", name="B", slug="b", protocol=SSOProtocol.OIDC,
-        )
-        assert hash(p1) == hash(p2)
-
 
 class TestSSOGlobalConfig:
     """測試 SSOGlobalConfig"""
@@ -358,21 +348,28 @@ class TestSSOUserLink:
     """測試 SSOUserLink 值物件"""
 
     def test_creation(self):
-        link = SSOUserLink(
-            id="link-1",
-            user_id="user-1",
-            provider_id="provider-1",
-            external_id="ext-id-123",
-        )
+        link = SSOUserLink(**SSO_USER_LINK_DATA)
         assert link.id == "link-1"
         assert link.user_id == "user-1"
         assert link.provider_id == "provider-1"
         assert link.external_id == "ext-id-123"
         assert link.created_at is None
 
-    def test_is_frozen(self):
-        link = SSOUserLink(
-            id="link-1", user_id="user-1", provider_id="provider-1", external_id="ext-id-123"
-        )
-        with pytest.raises(AttributeError):
-            link.id = "changed"
+
+class TestValueObjectsAreFrozen:
+    """測試 SSO 值物件皆為不可變（frozen dataclass）"""
+
+    @pytest.mark.parametrize(
+        "cls,kwargs,field",
+        [
+            (SAMLConfig, SAML_CONFIG_DATA, "idp_entity_id"),
+            (OIDCConfig, OIDC_CONFIG_DATA, "client_id"),
+            (AttributeMapping, {}, "email"),
+            (SSOUserLink, SSO_USER_LINK_DATA, "id"),
+        ],
+        ids=["saml_config", "oidc_config", "attribute_mapping", "sso_user_link"],
+    )
+    def test_is_frozen(self, cls, kwargs, field):
+        obj = cls(**kwargs)
+        with pytest.raises(FrozenInstanceError):
+            setattr(obj, field, "changed")
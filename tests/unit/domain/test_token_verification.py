@@ -3,7 +3,6 @@ Unit tests for token verification functionality.
 """
 import pytest
 from datetime import datetime, timezone, timedelta
-from unittest.mock import patch
 import jwt
 
 from app.utils.token_generator import (
@@ -11,12 +10,29 @@ from app.utils.token_generator import (
     generate_token,
     TokenStatus,
     TokenVerificationResult,
-    TOKEN_EXPIRY_SECONDS,
 )
 from app.config import get_settings
 
 
-settings = get_settings()
+_NOW = datetime.now(timezone.utc)
+_VALID_WINDOW_PAYLOAD = {
+    'sub': 'user123',
+    'uid': 'testuser',
+    'iat': _NOW,
+    'exp': _NOW + timedelta(hours=1),
+}
+_EXPIRED_PAYLOAD = {
+    'sub': 'user123',
+    'uid': 'testuser',
+    'iat': _NOW - timedelta(hours=2),
+    'exp': _NOW - timedelta(hours=1),  # Expired 1 hour ago
+}
+
+
+@pytest.fixture(scope="module")
+def jwt_key():
+    """JWT signing key from the application settings."""
+    return get_settings().JWT_KEY
 
 
 class TestTokenVerificationResult:
@@ -65,17 +81,9 @@ class TestVerifyToken:
         assert result.payload['sub'] == 'user123'
         assert result.payload['uid'] == 'testuser'
 
-    def test_verify_expired_token(self):
+    def test_verify_expired_token(self, jwt_key):
         """Test verification of an expired token returns EXPIRED status."""
-        # Create a token that's already expired
-        now = datetime.now(timezone.utc)
-        payload = {
-            'sub': 'user123',
-            'uid': 'testuser',
-            'iat': now - timedelta(hours=2),
-            'exp': now - timedelta(hours=1),  # Expired 1 hour ago
-        }
-        expired_token = jwt.encode(payload, settings.JWT_KEY, algorithm='HS256')
+        expired_token = jwt.encode(_EXPIRED_PAYLOAD, jwt_key, algorithm='HS256')
 
         result = verify_token(expired_token)
 
@@ -84,45 +92,37 @@ class TestVerifyToken:
         assert result.is_valid is False
         assert result.payload is None
 
-    def test_verify_invalid_signature(self):
-        """Test verification of a token with invalid signature."""
-        # Create a token with a different key
-        payload = {
-            'sub': 'user123',
-            'uid': 'testuser',
-            'iat': datetime.now(timezone.utc),
-            'exp': datetime.now(timezone.utc) + timedelta(hours=1),
-        }
-        invalid_token = jwt.encode(payload, 'wrong_key', algorithm='HS256')
-
-        result = verify_token(invalid_token)
+    @pytest.mark.parametrize(
+        "token",
+        [
+            jwt.encode(_VALID_WINDOW_PAYLOAD, 'wrong_key', algorithm='HS256'),
+            'not.a.valid.token',
+            '',
+        ],
+        ids=["invalid_signature", "malformed", "empty"],
+    )
+    def test_verify_invalid_token(self, token):
+        """Test that a token with a bad signature, bad format or no content is INVALID."""
+        result = verify_token(token)
 
         assert result.status == TokenStatus.INVALID
         assert result.is_valid is False
         assert result.is_expired is False
         assert result.payload is None
 
-    def test_verify_malformed_token(self):
-        """Test verification of a malformed token."""
-        result = verify_token('not.a.valid.token')
-
-        assert result.status == TokenStatus.INVALID
-        assert result.is_valid is False
-        assert result.payload is None
-
-    def test_verify_empty_token(self):
-        """Test verification of an empty token."""
-        result = verify_token('')
-
-        assert result.status == TokenStatus.INVALID
-        assert result.is_valid is False
-
 
 class TestTokenStatus:
     """Tests for TokenStatus enum."""
 
-    def test_status_values(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (TokenStatus.VALID, 'valid'),
+            (TokenStatus.EXPIRED, 'expired'),
+            (TokenStatus.INVALID, 'invalid'),
+        ],
+        ids=["valid", "expired", "invalid"],
+    )
+    def test_status_values(self, member, value):
         """Test TokenStatus enum values."""
-        assert TokenStatus.VALID.value == 'valid'
-        assert TokenStatus.EXPIRED.value == 'expired'
-        assert TokenStatus.INVALID.value == 'invalid'
+        assert member.value == value
@@ -1,12 +1,16 @@
+import copy
+from dataclasses import FrozenInstanceError
+
 import pytest
 from datetime import date
-from uuid import UUID
 from app.domain.UserModel import (
     UserModel,
     UserRole,
     Profile,
     HashedPassword,
 )
+from tests.unit.domain.conftest import UUID4_RE
+
 
 # --- Test Data ---
 TEST_UID = "testuser123"
@@ -25,6 +29,18 @@ def mock_verify_func(raw_password: str, hashed_password: str) -> bool:
     return hashed_password == f"hashed_{raw_password}"
 
 
+@pytest.fixture(scope="module")
+def base_user():
+    """整個模組共用的已註冊使用者原型（唯讀）；會修改狀態的測試請使用 fresh_user。"""
+    return UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
+
+
+@pytest.fixture
+def fresh_user(base_user):
+    """base_user 的淺複製，供會修改狀態的測試使用。"""
+    return copy.copy(base_user)
+
+
 class TestUserRegistration:
     """測試使用者註冊相關功能"""
 
@@ -43,10 +59,7 @@ class TestUserRegistration:
         assert isinstance(user, UserModel)
 
         # 斷言 ID 是一個有效的 UUID
-        try:
-            UUID(user.id, version=4)
-        except ValueError:
-            pytest.fail("UserModel.id should be a valid UUIDv4 string")
+        assert UUID4_RE.fullmatch(user.id), "UserModel.id should be a valid UUIDv4 string"
 
         # 斷言初始屬性符合預期
         assert user.uid == TEST_UID
@@ -63,43 +76,37 @@ class TestUserRegistration:
 
         assert user1.id != user2.id
 
-    def test_user_registration_hashes_password(self):
+    def test_user_registration_hashes_password(self, base_user):
         """
         測試密碼在註冊時會被雜湊處理
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-
         # 確保密碼已經被雜湊（使用 mock hash function）
-        assert user._hashed_password.value == f"hashed_{TEST_PASSWORD}"
-        assert user._hashed_password.value != TEST_PASSWORD
+        assert base_user._hashed_password.value == f"hashed_{TEST_PASSWORD}"
+        assert base_user._hashed_password.value != TEST_PASSWORD
 
-    def test_user_registration_with_empty_profile(self):
+    def test_user_registration_with_empty_profile(self, base_user):
         """
         測試新註冊的使用者有空的個人資料
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-
-        assert user.profile.name is None
-        assert user.profile.birthdate is None
-        assert user.profile.description is None
+        assert base_user.profile.name is None
+        assert base_user.profile.birthdate is None
+        assert base_user.profile.description is None
 
 
 class TestPasswordVerification:
     """測試密碼驗證功能"""
 
-    def test_password_verification_with_correct_password(self):
+    def test_password_verification_with_correct_password(self, base_user):
         """
         測試使用正確的密碼進行驗證
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-        assert user.verify_password(TEST_PASSWORD, mock_verify_func) is True
+        assert base_user.verify_password(TEST_PASSWORD, mock_verify_func) is True
 
-    def test_password_verification_with_wrong_password(self):
+    def test_password_verification_with_wrong_password(self, base_user):
         """
         測試使用錯誤的密碼進行驗證
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-        assert user.verify_password("wrong_password", mock_verify_func) is False
+        assert base_user.verify_password("wrong_password", mock_verify_func) is False
 
     def test_password_verification_case_sensitive(self):
         """
@@ -118,79 +125,70 @@ class TestPasswordVerification:
         user = UserModel.register(TEST_UID, "actual_password", TEST_EMAIL, mock_hash_func)
         assert user.verify_password("", mock_verify_func) is False
 
-    def test_password_verification_multiple_times(self):
+    def test_password_verification_multiple_times(self, base_user):
         """
         測試多次密碼驗證的一致性
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-
         # 多次驗證應該保持一致
         for _ in range(5):
-            assert user.verify_password(TEST_PASSWORD, mock_verify_func) is True
-            assert user.verify_password("wrong", mock_verify_func) is False
+            assert base_user.verify_password(TEST_PASSWORD, mock_verify_func) is True
+            assert base_user.verify_password("wrong", mock_verify_func) is False
 
 
 class TestProfileUpdate:
     """測試個人資料更新功能"""
 
-    def test_profile_update_all_fields(self):
+    def test_profile_update_all_fields(self, fresh_user):
         """
         測試更新所有個人資料欄位
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-
         new_name = "John Doe"
         new_birthdate = date(1990, 1, 15)
         new_description = "A software developer."
 
-        user.update_profile(
+        fresh_user.update_profile(
             name=new_name,
             birthdate=new_birthdate,
             description=new_description
         )
 
-        assert user.profile.name == new_name
-        assert user.profile.birthdate == new_birthdate
-        assert user.profile.description == new_description
+        assert fresh_user.profile.name == new_name
+        assert fresh_user.profile.birthdate == new_birthdate
+        assert fresh_user.profile.description == new_description
 
-    def test_profile_update_overwrites_previous_data(self):
+    def test_profile_update_overwrites_previous_data(self, fresh_user):
         """
         測試更新個人資料會覆蓋之前的資料
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-
         # 第一次更新
-        user.update_profile("Alice", date(1985, 5, 20), "First description")
-        assert user.profile.name == "Alice"
+        fresh_user.update_profile("Alice", date(1985, 5, 20), "First description")
+        assert fresh_user.profile.name == "Alice"
 
         # 第二次更新應該覆蓋
-        user.update_profile("Bob", date(1990, 10, 15), "Second description")
-        assert user.profile.name == "Bob"
-        assert user.profile.birthdate == date(1990, 10, 15)
-        assert user.profile.description == "Second description"
+        fresh_user.update_profile("Bob", date(1990, 10, 15), "Second description")
+        assert fresh_user.profile.name == "Bob"
+        assert fresh_user.profile.birthdate == date(1990, 10, 15)
+        assert fresh_user.profile.description == "Second description"
 
-    def test_profile_update_creates_new_profile_instance(self):
+    def test_profile_update_creates_new_profile_instance(self, fresh_user):
         """
         測試更新個人資料會創建新的 Profile 實例（因為 Profile 是 frozen dataclass）
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-
-        old_profile = user.profile
-        user.update_profile("New Name", date(2000, 1, 1), "New description")
+        old_profile = fresh_user.profile
+        fresh_user.update_profile("New Name", date(2000, 1, 1), "New description")
 
         # 應該是不同的實例
-        assert user.profile is not old_profile
+        assert fresh_user.profile is not old_profile
 
 
 class TestUserRole:
     """測試使用者角色功能"""
 
-    def test_default_role_is_normal(self):
+    def test_default_role_is_normal(self, base_user):
         """
         測試新註冊使用者的預設角色是 NORMAL
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-        assert user.role == UserRole.NORMAL
+        assert base_user.role == UserRole.NORMAL
 
     def test_user_can_have_different_roles(self):
         """
@@ -218,13 +216,20 @@ class TestUserRole:
         assert admin_user.role == UserRole.ADMIN
         assert employee_user.role == UserRole.EMPLOYEE
 
-    def test_role_enum_values(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (UserRole.ADMIN, "ADMIN"),
+            (UserRole.EMPLOYEE, "EMPLOYEE"),
+            (UserRole.NORMAL, "NORMAL"),
+        ],
+        ids=["admin", "employee", "normal"],
+    )
+    def test_role_enum_values(self, member, value):
         """
         測試角色枚舉的值
         """
-        assert UserRole.ADMIN.value == "ADMIN"
-        assert UserRole.EMPLOYEE.value == "EMPLOYEE"
-        assert UserRole.NORMAL.value == "NORMAL"
+        assert member.value == value
 
 
 class TestHashedPassword:
@@ -294,7 +299,7 @@ class TestProfile:
         """
         profile = Profile(name="Alice")
 
-        with pytest.raises(Exception):  # FrozenInstanceError
+        with pytest.raises(FrozenInstanceError):
             profile.name = "Bob"
 
     def test_profile_equality(self):
@@ -369,29 +374,25 @@ class TestUserModelConstructor:
 class TestChangePassword:
     """測試變更密碼功能"""
 
-    def test_change_password_with_correct_old_password(self):
+    def test_change_password_with_correct_old_password(self, fresh_user):
         """
         測試使用正確的舊密碼成功變更密碼。
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-
-        user.change_password(
+        fresh_user.change_password(
             old_password=TEST_PASSWORD,
             new_password="new_password_456",
             verify_func=mock_verify_func,
             hash_func=mock_hash_func
         )
 
-        assert user._hashed_password.value == "hashed_new_password_456"
+        assert fresh_user._hashed_password.value == "hashed_new_password_456"
 
-    def test_change_password_with_wrong_old_password(self):
+    def test_change_password_with_wrong_old_password(self, fresh_user):
         """
         測試使用錯誤的舊密碼會拋出 ValueError。
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-
         with pytest.raises(ValueError, match="Old password is incorrect"):
-            user.change_password(
+            fresh_user.change_password(
                 old_password="wrong_password",
                 new_password="new_password_456",
                 verify_func=mock_verify_func,
@@ -399,23 +400,21 @@ class TestChangePassword:
             )
 
         # 密碼應該不變
-        assert user._hashed_password.value == f"hashed_{TEST_PASSWORD}"
+        assert fresh_user._hashed_password.value == f"hashed_{TEST_PASSWORD}"
 
-    def test_change_password_updates_hashed_value(self):
+    def test_change_password_updates_hashed_value(self, fresh_user):
         """
         測試變更密碼後舊密碼無法驗證，新密碼可以驗證。
         """
-        user = UserModel.register(TEST_UID, TEST_PASSWORD, TEST_EMAIL, mock_hash_func)
-
-        user.change_password(
+        fresh_user.change_password(
             old_password=TEST_PASSWORD,
             new_password="new_password_456",
             verify_func=mock_verify_func,
             hash_func=mock_hash_func
         )
 
-        assert user.verify_password("new_password_456", mock_verify_func) is True
-        assert user.verify_password(TEST_PASSWORD, mock_verify_func) is False
+        assert fresh_user.verify_password("new_password_456", mock_verify_func) is True
+        assert fresh_user.verify_password(TEST_PASSWORD, mock_verify_func) is False
 
 
 class TestPromoteToEmployee:
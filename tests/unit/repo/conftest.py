@@ -4,9 +4,10 @@ Fixtures for repository tests.
 import pytest
 from uuid import uuid4
 from datetime import datetime, date
-from sqlalchemy import create_engine, BigInteger
+from sqlalchemy import create_engine, event, BigInteger
 from sqlalchemy.ext.compiler import compiles
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 
 # SQLite 不支援 BigInteger 自動遞增，需要將 BigInteger 編譯為 INTEGER
@@ -29,10 +30,30 @@ from database.models.mqtt import MQTTMessage
 from app.domain.UserModel import UserRole
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_db_engine():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
+    """Create an in-memory SQLite database once for the whole test session.
+
+    StaticPool keeps a single DBAPI connection for the engine's lifetime, so the
+    in-memory database (and its schema) survives every connect/close cycle.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # pysqlite defers BEGIN until the first DML statement, which breaks SAVEPOINT.
+    # Disable its implicit transaction handling and emit BEGIN ourselves.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
     yield engine
     Base.metadata.drop_all(engine)
@@ -41,11 +62,23 @@ def test_db_engine():
 
 @pytest.fixture(scope="function")
 def test_db_session(test_db_engine):
-    """Create a test database session."""
-    SessionLocal = sessionmaker(bind=test_db_engine, expire_on_commit=False)
-    session = SessionLocal()
+    """Create a test database session wrapped in an outer transaction.
+
+    The session joins the connection's transaction via SAVEPOINTs, so commits made
+    by tests and repositories only release a savepoint; rolling back the outer
+    transaction on teardown discards everything the test wrote.
+    """
+    connection = test_db_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -57,14 +90,9 @@ def sample_roles(test_db_session: Session):
         Role(id=3, name="Intern", level=1),
     ]
 
-    for role in roles:
-        test_db_session.add(role)
-
+    test_db_session.add_all(roles)
     test_db_session.commit()
 
-    for role in roles:
-        test_db_session.refresh(role)
-
     return roles
 
 
@@ -78,14 +106,9 @@ def sample_authorities(test_db_session: Session):
         Authority(id=4, name="ADMIN", description="Admin access"),
     ]
 
-    for authority in authorities:
-        test_db_session.add(authority)
-
+    test_db_session.add_all(authorities)
     test_db_session.commit()
 
-    for authority in authorities:
-        test_db_session.refresh(authority)
-
     return authorities
 
 
@@ -141,14 +164,9 @@ def sample_users(test_db_session: Session):
         ),
     ]
 
-    for user in users:
-        test_db_session.add(user)
-
+    test_db_session.add_all(users)
     test_db_session.commit()
 
-    for user in users:
-        test_db_session.refresh(user)
-
     return users
 
 
@@ -182,14 +200,9 @@ def sample_schedules(test_db_session: Session, sample_users):
         ),
     ]
 
-    for schedule in schedules:
-        test_db_session.add(schedule)
-
+    test_db_session.add_all(schedules)
     test_db_session.commit()
 
-    for schedule in schedules:
-        test_db_session.refresh(schedule)
-
     return schedules
 
 
@@ -217,14 +230,9 @@ def sample_messages(test_db_session: Session, sample_users):
         ),
     ]
 
-    for message in messages:
-        test_db_session.add(message)
-
+    test_db_session.add_all(messages)
     test_db_session.commit()
 
-    for message in messages:
-        test_db_session.refresh(message)
-
     return messages
 
 
@@ -273,12 +281,7 @@ def sample_login_records(test_db_session: Session, sample_users):
         ),
     ]
 
-    for record in records:
-        test_db_session.add(record)
-
+    test_db_session.add_all(records)
     test_db_session.commit()
 
-    for record in records:
-        test_db_session.refresh(record)
-
     return records
@@ -29,21 +29,32 @@ from app.domain.ApprovalModel import (
 )
 
 
-def _make_leave_detail():
-    return LeaveDetail(
-        leave_type=LeaveType.ANNUAL,
-        start_date=datetime(2024, 12, 1, tzinfo=UTC),
-        end_date=datetime(2024, 12, 5, tzinfo=UTC),
-        reason="Annual leave",
-    )
+# LeaveDetail / ExpenseDetail 為 frozen dataclass，可安全地在測試間共用
+LEAVE_DETAIL = LeaveDetail(
+    leave_type=LeaveType.ANNUAL,
+    start_date=datetime(2024, 12, 1, tzinfo=UTC),
+    end_date=datetime(2024, 12, 5, tzinfo=UTC),
+    reason="Annual leave",
+)
+
+EXPENSE_DETAIL = ExpenseDetail(
+    amount=1500.0,
+    category="Travel",
+    description="Business trip expenses",
+)
 
 
-def _make_expense_detail():
-    return ExpenseDetail(
-        amount=1500.0,
-        category="Travel",
-        description="Business trip expenses",
-    )
+def _seed_leave_requests(session: Session, requester_id: str, approver_id: str, count: int) -> None:
+    """透過 ApprovalRepository.add_all 一次寫入多筆待簽核的請假申請（單次 flush / commit）。"""
+    ApprovalRepository(session).add_all([
+        ApprovalRequest.create_leave_request(
+            requester_id=requester_id,
+            detail=LEAVE_DETAIL,
+            approver_ids=[approver_id],
+        )
+        for _ in range(count)
+    ])
+    session.commit()
 
 
 class TestApprovalRepository:
@@ -57,7 +68,7 @@ class TestApprovalRepository:
 
         request = ApprovalRequest.create_leave_request(
             requester_id=requester_id,
-            detail=_make_leave_detail(),
+            detail=LEAVE_DETAIL,
             approver_ids=[approver_id],
         )
 
@@ -79,7 +90,7 @@ class TestApprovalRepository:
 
         request = ApprovalRequest.create_expense_request(
             requester_id=requester_id,
-            detail=_make_expense_detail(),
+            detail=EXPENSE_DETAIL,
             approver_ids=[approver_id],
         )
 
@@ -98,7 +109,7 @@ class TestApprovalRepository:
 
         request = ApprovalRequest.create_leave_request(
             requester_id=requester_id,
-            detail=_make_leave_detail(),
+            detail=LEAVE_DETAIL,
             approver_ids=approver_ids,
         )
 
@@ -109,6 +120,35 @@ class TestApprovalRepository:
         assert result.steps[0].step_order == 1
         assert result.steps[1].step_order == 2
 
+    def test_add_all_persists_every_request(self, test_db_session: Session, sample_users):
+        """測試批次新增多筆申請（含簽核步驟）"""
+        repo = ApprovalRepository(test_db_session)
+        requester_id = str(sample_users[0].id)
+        approver_ids = [str(sample_users[1].id), str(sample_users[2].id)]
+
+        requests = [
+            ApprovalRequest.create_leave_request(
+                requester_id=requester_id,
+                detail=LEAVE_DETAIL,
+                approver_ids=approver_ids,
+            ),
+            ApprovalRequest.create_expense_request(
+                requester_id=requester_id,
+                detail=EXPENSE_DETAIL,
+                approver_ids=approver_ids,
+            ),
+        ]
+
+        repo.add_all(requests)
+        test_db_session.commit()
+
+        for request in requests:
+            found = repo.get_by_id(request.id)
+            assert found is not None
+            assert found.type == request.type
+            assert found.detail == request.detail
+            assert [s.approver_id for s in found.steps] == approver_ids
+
     def test_get_by_id_existing(self, test_db_session: Session, sample_users):
         """測試以 ID 查詢存在的申請"""
         repo = ApprovalRepository(test_db_session)
@@ -117,7 +157,7 @@ class TestApprovalRepository:
 
         request = ApprovalRequest.create_leave_request(
             requester_id=requester_id,
-            detail=_make_leave_detail(),
+            detail=LEAVE_DETAIL,
             approver_ids=[approver_id],
         )
         created = repo.add(request)
@@ -159,7 +199,7 @@ class TestApprovalRepository:
 
         request = ApprovalRequest.create_leave_request(
             requester_id=requester_id,
-            detail=_make_leave_detail(),
+            detail=LEAVE_DETAIL,
             approver_ids=[str(approver.id)],
         )
         created = repo.add(request)
@@ -185,7 +225,7 @@ class TestApprovalRepository:
 
         request = ApprovalRequest.create_leave_request(
             requester_id=requester_id,
-            detail=_make_leave_detail(),
+            detail=LEAVE_DETAIL,
             approver_ids=[approver_id],
         )
         created = repo.add(request)
@@ -211,7 +251,7 @@ class TestApprovalQueryRepository:
 
         request = ApprovalRequest.create_leave_request(
             requester_id=str(sample_users[0].id),
-            detail=_make_leave_detail(),
+            detail=LEAVE_DETAIL,
             approver_ids=[str(sample_users[2].id)],
         )
         created = write_repo.add(request)
@@ -223,18 +263,10 @@ class TestApprovalQueryRepository:
 
     def test_get_by_requester(self, test_db_session: Session, sample_users):
         """測試依申請人查詢"""
-        write_repo = ApprovalRepository(test_db_session)
         query_repo = ApprovalQueryRepository(test_db_session)
         requester_id = str(sample_users[0].id)
 
-        for _ in range(3):
-            request = ApprovalRequest.create_leave_request(
-                requester_id=requester_id,
-                detail=_make_leave_detail(),
-                approver_ids=[str(sample_users[2].id)],
-            )
-            write_repo.add(request)
-        test_db_session.commit()
+        _seed_leave_requests(test_db_session, requester_id, str(sample_users[2].id), 3)
 
         results, total = query_repo.get_by_requester(requester_id, page=1, size=10)
 
@@ -252,12 +284,12 @@ class TestApprovalQueryRepository:
         # Create 2 requests, approve 1
         req1 = ApprovalRequest.create_leave_request(
             requester_id=requester_id,
-            detail=_make_leave_detail(),
+            detail=LEAVE_DETAIL,
             approver_ids=[approver_id],
         )
         req2 = ApprovalRequest.create_leave_request(
             requester_id=requester_id,
-            detail=_make_leave_detail(),
+            detail=LEAVE_DETAIL,
             approver_ids=[approver_id],
         )
         created1 = write_repo.add(req1)
@@ -275,18 +307,10 @@ class TestApprovalQueryRepository:
 
     def test_get_by_requester_pagination(self, test_db_session: Session, sample_users):
         """測試分頁查詢"""
-        write_repo = ApprovalRepository(test_db_session)
         query_repo = ApprovalQueryRepository(test_db_session)
         requester_id = str(sample_users[0].id)
 
-        for _ in range(5):
-            request = ApprovalRequest.create_leave_request(
-                requester_id=requester_id,
-                detail=_make_leave_detail(),
-                approver_ids=[str(sample_users[2].id)],
-            )
-            write_repo.add(request)
-        test_db_session.commit()
+        _seed_leave_requests(test_db_session, requester_id, str(sample_users[2].id), 5)
 
         page1, total = query_repo.get_by_requester(requester_id, page=1, size=2)
         assert total == 5
@@ -301,7 +325,7 @@ class TestApprovalQueryRepository:
 
         request = ApprovalRequest.create_leave_request(
             requester_id=requester_id,
-            detail=_make_leave_detail(),
+            detail=LEAVE_DETAIL,
             approver_ids=[approver_id],
         )
         write_repo.add(request)
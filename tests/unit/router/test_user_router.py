@@ -95,6 +95,13 @@ class TestCreateUser:
         assert response.status_code == 200
         mock_service.add_user_profile.assert_called_once()
 
+    def test_create_user_invalid_payload_returns_422(self):
+        """測試缺少必填欄位時回傳 422"""
+        app = _create_app()
+        client = TestClient(app)
+        response = client.post("/users/create", json={"uid": "only_uid"})
+        assert response.status_code == 422
+
 
 class TestLoginUser:
     """測試 POST /users/login 端點"""
@@ -150,6 +157,13 @@ class TestListUsers:
         response = client.get("/users/?page=1&size=10")
         assert response.status_code == 403
 
+    def test_list_users_unauthenticated_returns_401(self):
+        """測試未認證時回傳 401"""
+        app = _create_app()
+        client = TestClient(app)
+        response = client.get("/users/?page=1&size=10")
+        assert response.status_code == 401
+
 
 class TestSearchUsers:
     """測試 GET /users/search 端點"""
@@ -168,6 +182,13 @@ class TestSearchUsers:
         response = client.get("/users/search?keyword=test")
         assert response.status_code == 200
 
+    def test_search_users_unauthenticated_returns_401(self):
+        """測試未認證時回傳 401"""
+        app = _create_app()
+        client = TestClient(app)
+        response = client.get("/users/search?keyword=test")
+        assert response.status_code == 401
+
 
 class TestVerifyEmail:
     """測試 GET /users/verify-email 端點"""